@@ -15,6 +15,15 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Indexes whose definition depends on deployment settings, so they are not
+# declared on the models and autogenerate must leave them alone
+DEPLOYMENT_INDEXES = {"ix_entities_local"}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Exclude deployment-specific indexes from autogenerate comparisons."""
+    return not (type_ == "index" and name in DEPLOYMENT_INDEXES)
+
 
 def get_url() -> str:
     """Get database URL from settings or alembic config."""
@@ -33,6 +42,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -51,7 +61,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
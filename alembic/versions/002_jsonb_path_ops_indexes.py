@@ -0,0 +1,47 @@
+"""Use jsonb_path_ops and trigram indexes for entity data.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Containment (@>) queries only need jsonb_path_ops, which is much smaller
+    op.drop_index("ix_entities_data_name", table_name="entities")
+    op.create_index(
+        "ix_entities_data_gin",
+        "entities",
+        ["data"],
+        postgresql_using="gin",
+        postgresql_ops={"data": "jsonb_path_ops"},
+    )
+
+    # Substring (ILIKE '%...%') search on the name field
+    op.execute(
+        "CREATE INDEX ix_entities_data_name_trgm ON entities "
+        "USING gin ((data ->> 'name') gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entities_data_name_trgm", table_name="entities")
+    op.drop_index("ix_entities_data_gin", table_name="entities")
+    op.create_index(
+        "ix_entities_data_name",
+        "entities",
+        ["data"],
+        postgresql_using="gin",
+    )
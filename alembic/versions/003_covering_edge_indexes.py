@@ -0,0 +1,45 @@
+"""Make the edge (endpoint, type) indexes covering.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # INCLUDE the opposite endpoint so neighbor lookups are index-only scans
+    op.drop_index("ix_edges_src_type", table_name="edges")
+    op.drop_index("ix_edges_dst_type", table_name="edges")
+    op.create_index(
+        "ix_edges_src_type_covering",
+        "edges",
+        ["src_id", "type"],
+        postgresql_include=["dst_id", "authority_id"],
+    )
+    op.create_index(
+        "ix_edges_dst_type_covering",
+        "edges",
+        ["dst_id", "type"],
+        postgresql_include=["src_id", "authority_id"],
+    )
+
+    # Index-only scans need an up-to-date visibility map
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM ANALYZE edges")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_edges_dst_type_covering", table_name="edges")
+    op.drop_index("ix_edges_src_type_covering", table_name="edges")
+    op.create_index("ix_edges_src_type", "edges", ["src_id", "type"])
+    op.create_index("ix_edges_dst_type", "edges", ["dst_id", "type"])
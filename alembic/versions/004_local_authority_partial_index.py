@@ -0,0 +1,39 @@
+"""Partial index for listing the local authority's entities.
+
+The index predicate is the instance id configured when the migration runs
+(settings.instance.id). If the instance id changes later, downgrade and
+re-apply this revision so the predicate matches again.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from fkg.settings import get_settings
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    local_id = get_settings().instance.id
+
+    # Matches the list ordering, restricted to rows this instance owns
+    op.create_index(
+        "ix_entities_local",
+        "entities",
+        ["type", sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.column("authority_id") == sa.literal(local_id),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entities_local", table_name="entities")
@@ -0,0 +1,25 @@
+"""Index sources by list order for keyset pagination.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scanned backwards for ORDER BY created_at DESC, id DESC
+    op.create_index("ix_sources_created_at_id", "sources", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sources_created_at_id", table_name="sources")
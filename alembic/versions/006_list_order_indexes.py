@@ -0,0 +1,27 @@
+"""Index entities and edges by list order for keyset pagination.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scanned backwards for ORDER BY created_at DESC, id DESC
+    op.create_index("ix_entities_created_at_id", "entities", ["created_at", "id"])
+    op.create_index("ix_edges_created_at_id", "edges", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_edges_created_at_id", table_name="edges")
+    op.drop_index("ix_entities_created_at_id", table_name="entities")
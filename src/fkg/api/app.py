@@ -6,7 +6,9 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from fkg.api.responses import ORJSONResponse
 from fkg.api.routes import edges, entities, health, pkg, provenance, whoami
+from fkg.db import dispose_engines, enable_slow_query_logging
 from fkg.settings import get_settings
 
 
@@ -16,17 +18,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     yield
     # Shutdown
+    await dispose_engines()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = get_settings()
 
+    # Opt-in: without a threshold no listeners are installed
+    if settings.database.slow_query_ms is not None:
+        enable_slow_query_logging(settings.database.slow_query_ms)
+
     app = FastAPI(
         title="FKG-Core API",
         description="County-hosted knowledge graph runtime API",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS if enabled
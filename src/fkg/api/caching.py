@@ -0,0 +1,78 @@
+"""HTTP caching helpers: ETags, conditional responses and short-lived caches."""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+from fkg.api.responses import ORJSONResponse
+
+
+def compute_etag(payload: dict[str, Any]) -> str:
+    """Compute a strong ETag for a JSON-serializable payload."""
+    body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def conditional_json_response(
+    request: Request,
+    payload: dict[str, Any],
+    max_age: int,
+    etag: str | None = None,
+) -> Response:
+    """Return ``payload`` as JSON, or 304 if the client's copy is current.
+
+    Args:
+        request: Incoming request (for ``If-None-Match``)
+        payload: Response body
+        max_age: Seconds clients and proxies may reuse the response
+        etag: Precomputed ETag (computed from payload if omitted)
+
+    Returns:
+        A 304 response when ``If-None-Match`` matches, else a JSON response
+    """
+    etag = etag or compute_etag(payload)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    return ORJSONResponse(payload, headers=headers)
+
+
+class AsyncTTLCache[T]:
+    """Single-value cache whose loader runs at most once per TTL window.
+
+    Concurrent callers that find the value expired wait on a lock, so only
+    one of them runs the loader.
+    """
+
+    def __init__(self, ttl: float):
+        """Initialize with a time-to-live in seconds."""
+        self.ttl = ttl
+        self._value: T | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value, reloading it if it has expired."""
+        if time.monotonic() < self._expires_at:
+            return self._value  # type: ignore[return-value]
+
+        async with self._lock:
+            # Another caller may have refreshed while we waited
+            if time.monotonic() < self._expires_at:
+                return self._value  # type: ignore[return-value]
+            self._value = await loader()
+            self._expires_at = time.monotonic() + self.ttl
+            return self._value
+
+    def clear(self) -> None:
+        """Drop the cached value."""
+        self._value = None
+        self._expires_at = 0.0
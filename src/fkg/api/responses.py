@@ -0,0 +1,22 @@
+"""Response classes for the API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from fkg.serialization import dumps_json
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson serializes datetimes, UUIDs and nested JSONB payloads natively, so
+    model ``to_dict()`` results can be rendered without a Python-level
+    encoding pass. Return it directly from a route to also skip FastAPI's
+    ``jsonable_encoder``. Payloads orjson cannot encode (integers wider than
+    64 bits in JSONB data) are rendered with json instead.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content, option=orjson.OPT_NON_STR_KEYS)
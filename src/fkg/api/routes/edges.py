@@ -1,9 +1,12 @@
 """Edge API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fkg.db import get_sync_session
-from fkg.storage.edges import EdgeStorage
+from fkg.api.pagination import decode_cursor, encode_cursor
+from fkg.api.responses import ORJSONResponse
+from fkg.db import get_async_session
+from fkg.storage.edges import async_edge_storage as storage
 
 router = APIRouter()
 
@@ -16,42 +19,52 @@ async def list_edges(
     authority_id: str | None = Query(None, description="Filter by authority"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(False, description="Also count all matching edges"),
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """List edges with optional filtering."""
-    session = get_sync_session()
-    try:
-        storage = EdgeStorage(session)
-        edges = storage.list(
-            edge_type=type,
-            src_id=src_id,
-            dst_id=dst_id,
-            authority_id=authority_id,
-            limit=limit,
-            offset=offset,
+    """List edges with optional filtering.
+
+    Prefer ``cursor`` over ``offset`` for deep pages: it seeks on the
+    (created_at, id) sort key instead of scanning and discarding rows.
+    """
+    # Fetch one extra row to learn whether another page exists
+    edges = await storage.list_rows(
+        session,
+        edge_type=type,
+        src_id=src_id,
+        dst_id=dst_id,
+        authority_id=authority_id,
+        limit=limit + 1,
+        offset=offset,
+        after=decode_cursor(cursor) if cursor else None,
+    )
+    next_cursor = None
+    if len(edges) > limit:
+        edges = edges[:limit]
+        next_cursor = encode_cursor(edges[-1]["created_at"], edges[-1]["id"])
+
+    total = None
+    if include_total:
+        total = await storage.count(
+            session, edge_type=type, authority_id=authority_id, src_id=src_id, dst_id=dst_id
         )
-        total = storage.count(edge_type=type, authority_id=authority_id)
 
-        return {
-            "items": [e.to_dict() for e in edges],
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
-    finally:
-        session.close()
+    return ORJSONResponse({
+        "items": edges,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor,
+    })
 
 
 @router.get("/{edge_id}")
-async def get_edge(edge_id: str):
+async def get_edge(edge_id: str, session: AsyncSession = Depends(get_async_session)):
     """Get an edge by ID."""
-    session = get_sync_session()
-    try:
-        storage = EdgeStorage(session)
-        edge = storage.get(edge_id)
+    edge = await storage.get(session, edge_id)
 
-        if edge is None:
-            raise HTTPException(status_code=404, detail="Edge not found")
+    if edge is None:
+        raise HTTPException(status_code=404, detail="Edge not found")
 
-        return edge.to_dict()
-    finally:
-        session.close()
+    return ORJSONResponse(edge.to_dict())
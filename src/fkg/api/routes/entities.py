@@ -2,10 +2,13 @@
 
 from typing import Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fkg.db import get_sync_session
-from fkg.storage.entities import EntityStorage
+from fkg.api.pagination import decode_cursor, encode_cursor
+from fkg.api.responses import ORJSONResponse
+from fkg.db import get_async_session
+from fkg.storage.entities import async_entity_storage as storage
 
 router = APIRouter()
 
@@ -13,48 +16,60 @@ router = APIRouter()
 @router.get("")
 async def list_entities(
     type: str | None = Query(None, description="Filter by entity type"),
-    query: str | None = Query(None, description="Search query (matches name)"),
+    query: str | None = Query(None, description="Search query (substring of name)"),
+    name: str | None = Query(None, description="Exact name match"),
     authority_id: str | None = Query(None, description="Filter by authority"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(False, description="Also count all matching entities"),
+    session: AsyncSession = Depends(get_async_session),
 ):
-    """List entities with optional filtering."""
-    session = get_sync_session()
-    try:
-        storage = EntityStorage(session)
-        entities = storage.list(
-            entity_type=type,
-            authority_id=authority_id,
-            query=query,
-            limit=limit,
-            offset=offset,
+    """List entities with optional filtering.
+
+    Prefer ``cursor`` over ``offset`` for deep pages: it seeks on the
+    (created_at, id) sort key instead of scanning and discarding rows.
+    """
+    # Fetch one extra row to learn whether another page exists
+    entities = await storage.list_rows(
+        session,
+        entity_type=type,
+        authority_id=authority_id,
+        query=query,
+        limit=limit + 1,
+        offset=offset,
+        after=decode_cursor(cursor) if cursor else None,
+        name=name,
+    )
+    next_cursor = None
+    if len(entities) > limit:
+        entities = entities[:limit]
+        next_cursor = encode_cursor(entities[-1]["created_at"], entities[-1]["id"])
+
+    total = None
+    if include_total:
+        total = await storage.count(
+            session, entity_type=type, authority_id=authority_id, query=query, name=name
         )
-        total = storage.count(entity_type=type, authority_id=authority_id)
 
-        return {
-            "items": [e.to_dict() for e in entities],
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
-    finally:
-        session.close()
+    return ORJSONResponse({
+        "items": entities,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor,
+    })
 
 
 @router.get("/{entity_id}")
-async def get_entity(entity_id: str):
+async def get_entity(entity_id: str, session: AsyncSession = Depends(get_async_session)):
     """Get an entity by ID."""
-    session = get_sync_session()
-    try:
-        storage = EntityStorage(session)
-        entity = storage.get(entity_id)
+    entity = await storage.get(session, entity_id)
 
-        if entity is None:
-            raise HTTPException(status_code=404, detail="Entity not found")
+    if entity is None:
+        raise HTTPException(status_code=404, detail="Entity not found")
 
-        return entity.to_dict()
-    finally:
-        session.close()
+    return ORJSONResponse(entity.to_dict())
 
 
 @router.get("/{entity_id}/neighbors")
@@ -63,29 +78,24 @@ async def get_neighbors(
     edge_type: str | None = Query(None, description="Filter by edge type"),
     direction: Literal["out", "in"] = Query("out", description="Edge direction"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
+    session: AsyncSession = Depends(get_async_session),
 ):
     """Get neighboring entities connected by edges."""
-    session = get_sync_session()
-    try:
-        storage = EntityStorage(session)
-
-        # Check entity exists
-        entity = storage.get(entity_id)
-        if entity is None:
-            raise HTTPException(status_code=404, detail="Entity not found")
-
-        neighbors = storage.get_neighbors(
-            entity_id,
-            edge_type=edge_type,
-            direction=direction,
-            limit=limit,
-        )
-
-        return {
-            "entity_id": entity_id,
-            "direction": direction,
-            "edge_type": edge_type,
-            "neighbors": [n.to_dict() for n in neighbors],
-        }
-    finally:
-        session.close()
+    neighbors = await storage.get_neighbors(
+        session,
+        entity_id,
+        edge_type=edge_type,
+        direction=direction,
+        limit=limit,
+    )
+
+    # Only an empty result needs the existence check
+    if not neighbors and await storage.get(session, entity_id) is None:
+        raise HTTPException(status_code=404, detail="Entity not found")
+
+    return ORJSONResponse({
+        "entity_id": entity_id,
+        "direction": direction,
+        "edge_type": edge_type,
+        "neighbors": [n.to_dict() for n in neighbors],
+    })
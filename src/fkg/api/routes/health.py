@@ -2,15 +2,20 @@
 
 from fastapi import APIRouter
 
-from fkg.db import check_database_connection
+from fkg.api.caching import AsyncTTLCache
+from fkg.db import check_database_connection_async
 
 router = APIRouter()
 
+# Frequent liveness probes share one database ping per window
+HEALTH_CHECK_TTL = 2.0
+_db_status: AsyncTTLCache[bool] = AsyncTTLCache(ttl=HEALTH_CHECK_TTL)
+
 
 @router.get("/health")
 async def health_check():
     """Check API and database health."""
-    db_ok = check_database_connection()
+    db_ok = await _db_status.get(check_database_connection_async)
 
     return {
         "status": "healthy" if db_ok else "degraded",
@@ -1,92 +1,83 @@
 """PKG API endpoints."""
 
-import io
-import tempfile
-import zipfile
-from pathlib import Path
+import asyncio
+import itertools
+from datetime import datetime, timezone
+from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fkg.db import get_sync_session
-from fkg.pkg.export import export_pkg
+from fkg.api.caching import AsyncTTLCache, conditional_json_response
+from fkg.db import get_async_session, get_sync_session
+from fkg.pkg.archive import stream_zip
+from fkg.pkg.export import PkgWriter, export_pkg
 from fkg.settings import get_settings
 
 router = APIRouter()
 
+# Seconds a computed manifest is reused (server-side and by clients)
+MANIFEST_TTL = 30
+_manifest_cache: AsyncTTLCache[dict[str, Any]] = AsyncTTLCache(ttl=MANIFEST_TTL)
+
+
+def _export_latest(writer: PkgWriter) -> None:
+    """Export the local PKG through ``writer`` (blocking)."""
+    with get_sync_session() as session:
+        export_pkg(session, writer, include_changelog=True)
+        session.commit()
+
 
 @router.get("/latest")
 async def get_latest_pkg():
-    """Download the latest PKG as a zip file."""
+    """Download the latest PKG as a zip file.
+
+    The export is compressed into the response as it is produced; no file
+    is written to disk.
+    """
+    settings = get_settings()
+
+    chunks = stream_zip(_export_latest)
+    # Pull the first chunk before responding so that failures early in the
+    # export (e.g. the database being down) still surface as a 500
+    first = await asyncio.to_thread(next, chunks, b"")
+
+    return StreamingResponse(
+        itertools.chain([first], chunks),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f"attachment; filename={settings.instance.id}-pkg-latest.zip"
+        },
+    )
+
+
+async def _load_manifest(session: AsyncSession) -> dict[str, Any]:
+    """Build the manifest summary (one round trip for all counts)."""
+    from fkg.storage.stats import get_graph_counts
+
+    counts = await get_graph_counts(session)
+
+    # Create manifest info without file checksums
     settings = get_settings()
 
-    # Create a temporary directory for export
-    with tempfile.TemporaryDirectory() as tmpdir:
-        pkg_dir = Path(tmpdir) / "pkg"
-
-        session = get_sync_session()
-        try:
-            # Export PKG
-            export_pkg(session, pkg_dir, include_changelog=True)
-            session.commit()
-        finally:
-            session.close()
-
-        # Create zip file in memory
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path in pkg_dir.rglob("*"):
-                if file_path.is_file():
-                    arc_name = file_path.relative_to(pkg_dir)
-                    zf.write(file_path, arc_name)
-
-        zip_buffer.seek(0)
-
-        # Return as streaming response
-        return StreamingResponse(
-            zip_buffer,
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename={settings.instance.id}-pkg-latest.zip"
-            },
-        )
+    return {
+        "version": "0.1",
+        "authority_id": settings.instance.id,
+        "authority_name": settings.instance.authority_name,
+        "jurisdiction": settings.instance.jurisdiction,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "schema_version": settings.instance.schema_version,
+        "counts": counts,
+    }
 
 
 @router.get("/manifest")
-async def get_manifest():
-    """Get the current PKG manifest (without downloading full PKG)."""
-    import tempfile
-    from pathlib import Path
-
-    from fkg.pkg.manifest import create_manifest
-    from fkg.storage.edges import EdgeStorage
-    from fkg.storage.entities import EntityStorage
-    from fkg.storage.sources import SourceStorage
-
-    session = get_sync_session()
-    try:
-        entity_count = EntityStorage(session).count()
-        edge_count = EdgeStorage(session).count()
-        source_count = SourceStorage(session).count_sources()
-
-        # Create manifest info without file checksums
-        settings = get_settings()
-        from datetime import datetime, timezone
-
-        manifest = {
-            "version": "0.1",
-            "authority_id": settings.instance.id,
-            "authority_name": settings.instance.authority_name,
-            "jurisdiction": settings.instance.jurisdiction,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "schema_version": settings.instance.schema_version,
-            "counts": {
-                "entities": entity_count,
-                "edges": edge_count,
-                "sources": source_count,
-            },
-        }
-
-        return manifest
-    finally:
-        session.close()
+async def get_manifest(request: Request, session: AsyncSession = Depends(get_async_session)):
+    """Get the current PKG manifest (without downloading full PKG).
+
+    Counts are cached for MANIFEST_TTL seconds, so at most one counting
+    query runs per window.
+    """
+    manifest = await _manifest_cache.get(lambda: _load_manifest(session))
+    return conditional_json_response(request, manifest, MANIFEST_TTL)
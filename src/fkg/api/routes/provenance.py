@@ -1,46 +1,38 @@
 """Provenance API endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from fkg.db import get_sync_session
-from fkg.storage.entities import EntityStorage
-from fkg.storage.sources import SourceStorage
+from fkg.api.responses import ORJSONResponse
+from fkg.db import get_async_session
+from fkg.storage.entities import async_entity_storage
+from fkg.storage.sources import async_source_storage
 
 router = APIRouter()
 
 
 @router.get("/entities/{entity_id}/provenance")
-async def get_entity_provenance(entity_id: str):
+async def get_entity_provenance(
+    entity_id: str, session: AsyncSession = Depends(get_async_session)
+):
     """Get provenance information for an entity."""
-    session = get_sync_session()
-    try:
-        entity_storage = EntityStorage(session)
-        source_storage = SourceStorage(session)
+    # Check entity exists
+    entity = await async_entity_storage.get(session, entity_id)
+    if entity is None:
+        raise HTTPException(status_code=404, detail="Entity not found")
 
-        # Check entity exists
-        entity = entity_storage.get(entity_id)
-        if entity is None:
-            raise HTTPException(status_code=404, detail="Entity not found")
+    # Get provenance info
+    provenance = await async_source_storage.get_entity_provenance(session, entity_id)
 
-        # Get provenance info
-        provenance = source_storage.get_entity_provenance(entity_id)
-
-        return provenance
-    finally:
-        session.close()
+    return ORJSONResponse(provenance)
 
 
 @router.get("/sources/{source_id}")
-async def get_source(source_id: str):
+async def get_source(source_id: str, session: AsyncSession = Depends(get_async_session)):
     """Get a source by ID."""
-    session = get_sync_session()
-    try:
-        storage = SourceStorage(session)
-        source = storage.get_source(source_id)
+    source = await async_source_storage.get_source(session, source_id)
 
-        if source is None:
-            raise HTTPException(status_code=404, detail="Source not found")
+    if source is None:
+        raise HTTPException(status_code=404, detail="Source not found")
 
-        return source.to_dict()
-    finally:
-        session.close()
+    return ORJSONResponse(source.to_dict())
@@ -1,21 +1,27 @@
 """Instance identity endpoint."""
 
-from fastapi import APIRouter
+from functools import lru_cache
 
+from fastapi import APIRouter, Request
+
+from fkg.api.caching import compute_etag, conditional_json_response
 from fkg.settings import get_settings
 from fkg.validate.registry import get_registry
 
 router = APIRouter()
 
+# Identity only changes on restart, so clients may reuse it for a while
+WHOAMI_MAX_AGE = 300
 
-@router.get("/whoami")
-async def whoami():
-    """Get instance identity information."""
+
+@lru_cache(maxsize=1)
+def _identity(instance_id: str) -> tuple[dict, str]:
+    """Build the identity payload and its ETag (once per instance)."""
     settings = get_settings()
     registry = get_registry()
 
-    return {
-        "instance_id": settings.instance.id,
+    payload = {
+        "instance_id": instance_id,
         "authority_name": settings.instance.authority_name,
         "jurisdiction": settings.instance.jurisdiction,
         "public_key": settings.instance.public_key,
@@ -23,3 +29,11 @@ async def whoami():
         "available_schema_versions": registry.list_versions(),
         "available_entity_types": registry.list_entity_types(settings.instance.schema_version),
     }
+    return payload, compute_etag(payload)
+
+
+@router.get("/whoami")
+async def whoami(request: Request):
+    """Get instance identity information."""
+    payload, etag = _identity(get_settings().instance.id)
+    return conditional_json_response(request, payload, WHOAMI_MAX_AGE, etag=etag)
@@ -0,0 +1,143 @@
+"""Bulk writes through Postgres COPY."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import FromClause, Table
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+
+def supports_copy(session: Session) -> bool:
+    """Whether the session's connection can load rows with COPY (psycopg only)."""
+    connection = session.connection().connection.driver_connection
+    return isinstance(connection, psycopg.Connection)
+
+
+def _cursor(session: Session) -> psycopg.Cursor[Any]:
+    """Open a psycopg cursor on the session's connection and transaction."""
+    # Raw SQL bypasses the unit of work, so write out pending objects first
+    session.flush()
+    connection = session.connection().connection.driver_connection
+    if not isinstance(connection, psycopg.Connection):
+        raise TypeError(f"COPY needs the psycopg driver, not {type(connection).__name__}")
+    return connection.cursor()
+
+
+def _table_name(table: FromClause) -> str:
+    """Name of a mapped table (models expose ``__table__`` as a FromClause)."""
+    if not isinstance(table, Table):
+        raise TypeError(f"COPY needs a Table, not {type(table).__name__}")
+    return table.name
+
+
+def _copy_rows(
+    cursor: psycopg.Cursor[Any],
+    table_name: str,
+    columns: Sequence[str],
+    json_columns: set[str],
+    rows: Iterable[dict[str, Any]],
+) -> None:
+    """Stream ``rows`` into ``table_name`` with COPY ... FROM STDIN."""
+    stmt = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(table_name), sql.SQL(", ").join(map(sql.Identifier, columns))
+    )
+    with cursor.copy(stmt) as copy:
+        for values in rows:
+            # JSONB is sent as text, serialized as the engine would
+            copy.write_row(
+                [json.dumps(values[c]) if c in json_columns else values[c] for c in columns]
+            )
+
+
+def _json_columns(table: FromClause, columns: Sequence[str]) -> set[str]:
+    return {c for c in columns if isinstance(table.c[c].type, JSONB)}
+
+
+def copy_insert(
+    session: Session,
+    table: FromClause,
+    columns: Sequence[str],
+    rows: Iterable[dict[str, Any]],
+) -> None:
+    """Insert rows with COPY instead of INSERT statements.
+
+    Rows are written in iteration order, so serial columns are assigned in
+    that order.
+
+    Args:
+        session: Database session (must use the psycopg driver)
+        table: Table to insert into
+        columns: Columns to fill from each row dict
+        rows: Column values keyed by column name
+    """
+    with _cursor(session) as cursor:
+        _copy_rows(cursor, _table_name(table), columns, _json_columns(table, columns), rows)
+
+
+def copy_upsert(
+    session: Session,
+    table: FromClause,
+    columns: Sequence[str],
+    update_columns: Sequence[str],
+    rows: Iterable[dict[str, Any]],
+) -> set[str]:
+    """Insert or update rows keyed by ``id``, loading them with COPY.
+
+    Rows are copied into a temporary table and merged with one
+    INSERT ... SELECT ... ON CONFLICT (id) DO UPDATE, which sets
+    ``update_columns`` and ``updated_at``. IDs must be unique within
+    ``rows``; they are merged in ID order so concurrent writers lock shared
+    rows in the same order.
+
+    Args:
+        session: Database session (must use the psycopg driver)
+        table: Table with an ``id`` primary key and ``updated_at`` column
+        columns: Columns to fill from each row dict (including ``id``)
+        update_columns: Columns overwritten when the row already exists
+        rows: Column values keyed by column name
+
+    Returns:
+        IDs of the rows that were inserted rather than updated
+    """
+    table_name = _table_name(table)
+    staging_name = f"_fkg_copy_{table_name}"
+    staging = sql.Identifier(staging_name)
+    target = sql.Identifier(table_name)
+    column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+    assignments: list[sql.Composable] = [
+        sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(c)) for c in update_columns
+    ]
+    assignments.append(sql.SQL("updated_at = now()"))
+
+    with _cursor(session) as cursor:
+        cursor.execute(
+            sql.SQL(
+                "CREATE TEMPORARY TABLE {} ON COMMIT DROP AS SELECT {} FROM {} WITH NO DATA"
+            ).format(staging, column_list, target)
+        )
+        _copy_rows(cursor, staging_name, columns, _json_columns(table, columns), rows)
+        # Only fresh row versions have xmax = 0, i.e. were inserted
+        cursor.execute(
+            sql.SQL(
+                "INSERT INTO {target} ({columns}) SELECT {columns} FROM {staging} "
+                "ORDER BY id ON CONFLICT (id) DO UPDATE SET {assignments} "
+                "RETURNING id, xmax = 0"
+            ).format(
+                target=target,
+                columns=column_list,
+                staging=staging,
+                assignments=sql.SQL(", ").join(assignments),
+            )
+        )
+        created = {row_id for row_id, inserted in cursor.fetchall() if inserted}
+        # Dropped here so the next batch in this transaction can recreate it;
+        # on rollback ON COMMIT DROP cleans up instead
+        cursor.execute(sql.SQL("DROP TABLE {}").format(staging))
+
+    return created
@@ -1,12 +1,17 @@
 """Append-only changelog for tracking graph changes."""
 
+from collections.abc import Iterator
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
+from fkg.bulk import copy_insert, supports_copy
 from fkg.models.event import Event
 
+# Rows per server-side cursor fetch when streaming the changelog
+EXPORT_BATCH_SIZE = 1000
+
 
 def append_event(
     session: Session,
@@ -35,6 +40,25 @@ def append_event(
     return event
 
 
+def append_events(session: Session, events: list[dict[str, Any]], copy: bool = False) -> None:
+    """Append many events to the changelog in one statement.
+
+    Events get sequence numbers in list order.
+
+    Args:
+        session: Database session
+        events: Dicts with 'event_type', 'authority_id' and 'payload'
+        copy: Whether to load the events with COPY (faster for large lists);
+            ignored unless the driver is psycopg
+    """
+    if not events:
+        return
+    if copy and supports_copy(session):
+        copy_insert(session, Event.__table__, ("event_type", "authority_id", "payload"), events)
+    else:
+        session.execute(insert(Event), events)
+
+
 def get_events(
     session: Session,
     since_seq: int | None = None,
@@ -79,27 +103,32 @@ def get_latest_seq(session: Session) -> int | None:
     Returns:
         The latest sequence number, or None if no events exist
     """
-    stmt = select(Event.seq).order_by(Event.seq.desc()).limit(1)
-    result = session.execute(stmt).scalar()
-    return result
+    stmt = select(func.max(Event.seq))
+    return session.execute(stmt).scalar()
 
 
 def get_events_for_export(
     session: Session,
     authority_id: str | None = None,
-) -> list[Event]:
-    """Get all events for PKG export.
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[Event]:
+    """Stream all events for PKG export.
+
+    Rows are fetched through a server-side cursor in batches of
+    ``batch_size``, so memory stays bounded regardless of changelog size.
 
     Args:
         session: Database session
         authority_id: Optional authority filter
+        batch_size: Number of rows fetched per round trip
 
-    Returns:
-        List of events for export
+    Yields:
+        Events in sequence order
     """
     stmt = select(Event).order_by(Event.seq.asc())
 
     if authority_id:
         stmt = stmt.where(Event.authority_id == authority_id)
 
-    return list(session.execute(stmt).scalars().all())
+    result = session.execute(stmt.execution_options(stream_results=True, yield_per=batch_size))
+    yield from result.scalars()
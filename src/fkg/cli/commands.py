@@ -1,6 +1,6 @@
 """CLI sub-commands for FKG-Core."""
 
-import json
+from collections.abc import Iterator
 from pathlib import Path
 
 import typer
@@ -65,6 +65,7 @@ pkg_app = typer.Typer(help="PKG export/import operations")
 def pkg_export(
     out: Path = typer.Option("./pkg", "--out", "-o", help="Output directory"),
     no_changelog: bool = typer.Option(False, "--no-changelog", help="Exclude changelog"),
+    compress: bool = typer.Option(False, "--compress", help="Gzip the JSONL data files"),
 ):
     """Export PKG snapshot to directory."""
     from fkg.db import get_sync_session
@@ -72,26 +73,25 @@ def pkg_export(
 
     console.print(f"[cyan]Exporting PKG to {out}[/cyan]")
 
-    session = get_sync_session()
-    try:
-        stats = export_pkg(
-            session,
-            out,
-            include_changelog=not no_changelog,
-        )
-        session.commit()
-
-        console.print("\n[green]Export completed![/green]")
-        console.print(f"  Entities: {stats['entities']}")
-        console.print(f"  Edges: {stats['edges']}")
-        console.print(f"  Sources: {stats['sources']}")
-        console.print(f"  Manifest: {stats['manifest']}")
-    except Exception as e:
-        session.rollback()
-        console.print(f"[red]Export failed: {e}[/red]")
-        raise typer.Exit(1)
-    finally:
-        session.close()
+    with get_sync_session() as session:
+        try:
+            stats = export_pkg(
+                session,
+                out,
+                include_changelog=not no_changelog,
+                compress=compress,
+            )
+            session.commit()
+
+            console.print("\n[green]Export completed![/green]")
+            console.print(f"  Entities: {stats['entities']}")
+            console.print(f"  Edges: {stats['edges']}")
+            console.print(f"  Sources: {stats['sources']}")
+            console.print(f"  Manifest: {stats['manifest']}")
+        except Exception as e:
+            session.rollback()
+            console.print(f"[red]Export failed: {e}[/red]")
+            raise typer.Exit(1)
 
 
 @pkg_app.command("import")
@@ -108,27 +108,25 @@ def pkg_import(
     console.print(f"[cyan]Importing PKG from {path}[/cyan]")
     console.print(f"[dim]Authority: {authority}[/dim]")
 
-    session = get_sync_session()
-    try:
-        stats = import_pkg(
-            session,
-            path,
-            authority=authority,
-            verify_checksums_flag=not skip_verify,
-            validate=not skip_validate,
-        )
-
-        console.print("\n[green]Import completed![/green]")
-        console.print(f"  Entities: {stats['entities']}")
-        console.print(f"  Edges: {stats['edges']}")
-        console.print(f"  Sources: {stats['sources']}")
-        console.print(f"  Authority ID: {stats['authority_id']}")
-    except Exception as e:
-        session.rollback()
-        console.print(f"[red]Import failed: {e}[/red]")
-        raise typer.Exit(1)
-    finally:
-        session.close()
+    with get_sync_session() as session:
+        try:
+            stats = import_pkg(
+                session,
+                path,
+                authority=authority,
+                verify_checksums_flag=not skip_verify,
+                validate=not skip_validate,
+            )
+
+            console.print("\n[green]Import completed![/green]")
+            console.print(f"  Entities: {stats['entities']}")
+            console.print(f"  Edges: {stats['edges']}")
+            console.print(f"  Sources: {stats['sources']}")
+            console.print(f"  Authority ID: {stats['authority_id']}")
+        except Exception as e:
+            session.rollback()
+            console.print(f"[red]Import failed: {e}[/red]")
+            raise typer.Exit(1)
 
 
 @pkg_app.command("validate")
@@ -174,6 +172,201 @@ def pkg_validate(
 # Ingest commands
 ingest_app = typer.Typer(help="Data ingestion")
 
+# Default number of rows written per bulk upsert during ingest
+INGEST_BATCH_SIZE = 5000
+
+# Largest byte range handed to one worker by parallel CSV ingest
+CSV_SEGMENT_BYTES = 16 * 1024 * 1024
+
+# Smaller files are ingested in one process; starting workers costs more
+# than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _csv_entity(row: dict[str, str], entity_type: str, name_column: str) -> dict:
+    """Build an entity payload from a CSV row.
+
+    Non-empty fields are included as-is; non-empty 'type' or 'name'
+    columns take precedence over ``entity_type`` and ``name_column``.
+    """
+    data = {k: v for k, v in row.items() if v}
+    data.setdefault("type", entity_type)
+    data.setdefault("name", row.get(name_column, ""))
+    return data
+
+
+def _csv_segments(path: Path, workers: int) -> tuple[list[str], list[tuple[int, int]]]:
+    """Read the CSV header and split the remaining rows into byte ranges.
+
+    Ranges are at most CSV_SEGMENT_BYTES long (fewer when that would leave
+    workers idle) and each ends just after a newline, so every range holds
+    whole lines. Only valid when no record spans lines (see
+    _csv_segment_is_line_aligned).
+
+    Args:
+        path: Path to the CSV file
+        workers: Number of worker processes
+
+    Returns:
+        Tuple of (header field names, list of (start, end) byte offsets)
+    """
+    import csv
+
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        # The reader pulls lines only until the header record is complete, so
+        # a quoted newline in the header leaves f just past the whole record
+        lines = iter(lambda: f.readline().decode("utf-8"), "")
+        fieldnames = next(csv.reader(lines, strict=True), [])
+
+        segment_bytes = min(CSV_SEGMENT_BYTES, max(1, (size - f.tell()) // workers))
+        segments = []
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + segment_bytes, size))
+            # Extend to the end of the line the cut falls in
+            f.readline()
+            end = f.tell()
+            segments.append((start, end))
+            start = end
+
+    return fieldnames, segments
+
+
+def _segment_lines(path: Path, start: int, end: int) -> Iterator[str]:
+    """Yield the lines in the byte range [start, end) of a file."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        for line in f:
+            yield line.decode("utf-8")
+            remaining -= len(line)
+            if remaining <= 0:
+                break
+
+
+def _csv_segment_is_line_aligned(path: Path, start: int, end: int) -> bool:
+    """Whether every record in a byte range is a single line (runs in a worker).
+
+    A quoted newline either makes a record span two lines within the range
+    or leaves a quoted field open at its end, which strict parsing rejects.
+    The first quoted newline in a file always lies in a range that starts
+    on a record boundary, so checking every range finds it.
+    """
+    import csv
+
+    reader = csv.reader(_segment_lines(path, start, end), strict=True)
+    try:
+        records = sum(1 for _ in reader)
+    except csv.Error:
+        return False
+    return reader.line_num == records
+
+
+def _ingest_csv_segment(
+    path: Path,
+    start: int,
+    end: int,
+    fieldnames: list[str],
+    entity_type: str,
+    name_column: str,
+    validate: bool,
+    batch_size: int,
+) -> tuple[int, list[str]]:
+    """Ingest the CSV rows in one byte range (runs in a worker process).
+
+    Each batch is committed on its own, so rows locked by one worker are
+    released before it moves on.
+
+    Returns:
+        Tuple of (entities written, row error messages)
+    """
+    import csv
+
+    from fkg.db import get_sync_session
+    from fkg.storage.entities import EntityStorage
+
+    errors: list[str] = []
+
+    with get_sync_session() as session:
+        storage = EntityStorage(session)
+        count = 0
+
+        def flush(batch: list[dict]) -> int:
+            written = storage.upsert_many(
+                batch, validate=validate, on_error=lambda row, e: errors.append(str(e))
+            )
+            session.commit()
+            batch.clear()
+            return written
+
+        batch = []
+        for row in csv.DictReader(_segment_lines(path, start, end), fieldnames=fieldnames):
+            batch.append(_csv_entity(row, entity_type, name_column))
+            if len(batch) >= batch_size:
+                count += flush(batch)
+        count += flush(batch)
+
+    return count, errors
+
+
+def _ingest_csv_parallel(
+    path: Path,
+    entity_type: str,
+    name_column: str,
+    validate: bool,
+    batch_size: int,
+    workers: int,
+) -> tuple[int, int] | None:
+    """Ingest a CSV file with a pool of worker processes.
+
+    The workers first check their byte ranges for records spanning lines;
+    if any does, nothing is written and None is returned so the caller can
+    import the file in one process instead.
+
+    Returns:
+        Tuple of (entities written, row errors), or None
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    fieldnames, segments = _csv_segments(path, workers)
+    count = 0
+    errors = 0
+
+    # Spawned workers open their own database connections
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        checks = [
+            pool.submit(_csv_segment_is_line_aligned, path, start, end)
+            for start, end in segments
+        ]
+        if not all(check.result() for check in checks):
+            return None
+
+        futures = [
+            pool.submit(
+                _ingest_csv_segment,
+                path,
+                start,
+                end,
+                fieldnames,
+                entity_type,
+                name_column,
+                validate,
+                batch_size,
+            )
+            for start, end in segments
+        ]
+        for future in futures:
+            written, messages = future.result()
+            count += written
+            errors += len(messages)
+            for message in messages:
+                console.print(f"[yellow]Row error: {message}[/yellow]")
+
+    return count, errors
+
 
 @ingest_app.command("csv")
 def ingest_csv(
@@ -181,8 +374,19 @@ def ingest_csv(
     entity_type: str = typer.Option(..., "--entity-type", "-t", help="Entity type"),
     name_column: str = typer.Option("name", "--name-column", help="Column for entity name"),
     skip_validate: bool = typer.Option(False, "--skip-validate", help="Skip schema validation"),
+    batch_size: int = typer.Option(
+        INGEST_BATCH_SIZE, "--batch-size", min=1, help="Rows written per bulk upsert"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Worker processes for large files"
+    ),
 ):
-    """Import entities from a CSV file."""
+    """Import entities from a CSV file.
+
+    With --workers N, files of at least PARALLEL_MIN_BYTES are split into
+    byte ranges ingested by N processes. Each worker commits its own
+    batches, so a failed run may leave some rows imported.
+    """
     import csv
 
     from fkg.db import get_sync_session
@@ -191,88 +395,142 @@ def ingest_csv(
     console.print(f"[cyan]Importing CSV from {path}[/cyan]")
     console.print(f"[dim]Entity type: {entity_type}[/dim]")
 
-    session = get_sync_session()
-    storage = EntityStorage(session)
-    count = 0
-    errors = 0
-
-    try:
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    data = {
-                        "type": entity_type,
-                        "name": row.get(name_column, ""),
-                        **{k: v for k, v in row.items() if v},  # Include non-empty fields
-                    }
-                    storage.upsert(data, validate=not skip_validate)
-                    count += 1
-                except Exception as e:
-                    errors += 1
-                    console.print(f"[yellow]Row error: {e}[/yellow]")
-
-        session.commit()
-        console.print(f"\n[green]Imported {count} entities ({errors} errors)[/green]")
-    except Exception as e:
-        session.rollback()
-        console.print(f"[red]Import failed: {e}[/red]")
-        raise typer.Exit(1)
-    finally:
-        session.close()
+    if workers > 1 and path.stat().st_size >= PARALLEL_MIN_BYTES:
+        console.print(f"[dim]Workers: {workers}[/dim]")
+        try:
+            result = _ingest_csv_parallel(
+                path, entity_type, name_column, not skip_validate, batch_size, workers
+            )
+        except Exception as e:
+            console.print(f"[red]Import failed: {e}[/red]")
+            raise typer.Exit(1)
+        if result is not None:
+            count, errors = result
+            console.print(f"\n[green]Imported {count} entities ({errors} errors)[/green]")
+            return
+        console.print("[dim]Records span multiple lines; importing in one process[/dim]")
+
+    with get_sync_session() as session:
+        storage = EntityStorage(session)
+        count = 0
+        errors = 0
+
+        def report(row: dict, e: Exception) -> None:
+            nonlocal errors
+            errors += 1
+            console.print(f"[yellow]Row error: {e}[/yellow]")
+
+        def flush(batch: list[dict]) -> int:
+            written = storage.upsert_many(batch, validate=not skip_validate, on_error=report)
+            batch.clear()
+            return written
+
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                batch = []
+                for row in reader:
+                    batch.append(_csv_entity(row, entity_type, name_column))
+                    if len(batch) >= batch_size:
+                        count += flush(batch)
+                count += flush(batch)
+
+            session.commit()
+            console.print(f"\n[green]Imported {count} entities ({errors} errors)[/green]")
+        except Exception as e:
+            session.rollback()
+            console.print(f"[red]Import failed: {e}[/red]")
+            raise typer.Exit(1)
 
 
 @ingest_app.command("jsonl")
 def ingest_jsonl(
     path: Path = typer.Option(..., "--path", "-p", help="Path to JSONL file"),
     skip_validate: bool = typer.Option(False, "--skip-validate", help="Skip schema validation"),
+    batch_size: int = typer.Option(
+        INGEST_BATCH_SIZE, "--batch-size", min=1, help="Records written per bulk upsert"
+    ),
 ):
     """Import entities/edges from a JSONL file."""
     from fkg.db import get_sync_session
+    from fkg.serialization import loads_json
     from fkg.storage.edges import EdgeStorage
     from fkg.storage.entities import EntityStorage
 
     console.print(f"[cyan]Importing JSONL from {path}[/cyan]")
 
-    session = get_sync_session()
-    entity_storage = EntityStorage(session)
-    edge_storage = EdgeStorage(session)
-    entity_count = 0
-    edge_count = 0
-    errors = 0
-
-    try:
-        with open(path) as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    data = json.loads(line)
+    with get_sync_session() as session:
+        entity_storage = EntityStorage(session)
+        edge_storage = EdgeStorage(session)
+        entity_count = 0
+        edge_count = 0
+        errors = 0
+
+        entities: list[dict] = []
+        edges: list[dict] = []
+        # Line number of each batched record, keyed by id() of the record
+        line_nums: dict[int, int] = {}
+
+        def report(record: dict, e: Exception) -> None:
+            nonlocal errors
+            errors += 1
+            console.print(f"[yellow]Line {line_nums[id(record)]}: {e}[/yellow]")
+
+        def flush() -> None:
+            nonlocal entity_count, edge_count
+            # Entities go first so edges see the entities batched before them
+            entity_count += entity_storage.upsert_many(
+                entities, validate=not skip_validate, on_error=report
+            )
+            edge_count += edge_storage.upsert_many(
+                edges, validate=not skip_validate, on_error=report
+            )
+            entities.clear()
+            edges.clear()
+            line_nums.clear()
+
+        try:
+            with open(path, "rb") as f:
+                for line_num, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    try:
+                        data = loads_json(line)
+                    except Exception as e:
+                        errors += 1
+                        console.print(f"[yellow]Line {line_num}: {e}[/yellow]")
+                        continue
 
                     # Determine if entity or edge
+                    if not isinstance(data, dict):
+                        console.print(f"[yellow]Line {line_num}: Unknown record type[/yellow]")
+                        errors += 1
+                        continue
                     if "src_id" in data and "dst_id" in data:
-                        edge_storage.upsert(data, validate=not skip_validate)
-                        edge_count += 1
+                        edges.append(data)
                     elif "type" in data:
-                        entity_storage.upsert(data, validate=not skip_validate)
-                        entity_count += 1
+                        entities.append(data)
                     else:
                         console.print(f"[yellow]Line {line_num}: Unknown record type[/yellow]")
                         errors += 1
-                except Exception as e:
-                    errors += 1
-                    console.print(f"[yellow]Line {line_num}: {e}[/yellow]")
-
-        session.commit()
-        console.print(f"\n[green]Imported {entity_count} entities, {edge_count} edges ({errors} errors)[/green]")
-    except Exception as e:
-        session.rollback()
-        console.print(f"[red]Import failed: {e}[/red]")
-        raise typer.Exit(1)
-    finally:
-        session.close()
+                        continue
+
+                    line_nums[id(data)] = line_num
+                    if len(entities) + len(edges) >= batch_size:
+                        flush()
+                flush()
+
+            session.commit()
+            console.print(
+                f"\n[green]Imported {entity_count} entities, {edge_count} edges "
+                f"({errors} errors)[/green]"
+            )
+        except Exception as e:
+            session.rollback()
+            console.print(f"[red]Import failed: {e}[/red]")
+            raise typer.Exit(1)
 
 
 @ingest_app.command("markdown")
@@ -38,14 +38,22 @@ def serve(
     if port == 8000:
         port = settings.api.port
 
+    # Workers come from settings (api.workers / WEB_CONCURRENCY) so that every
+    # worker process sizes its connection pool from the same count
+    workers = 1 if reload else settings.api.workers
+
     console.print(f"[green]Starting FKG API server at http://{host}:{port}[/green]")
     console.print(f"[dim]Instance: {settings.instance.id}[/dim]")
+    if workers > 1:
+        console.print(f"[dim]Workers: {workers}[/dim]")
 
+    # uvicorn[standard] picks uvloop and httptools automatically when available
     uvicorn.run(
         "fkg.api.app:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
     )
 
 
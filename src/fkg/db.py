@@ -1,54 +1,120 @@
 """Database connection and session management."""
 
+import atexit
+import logging
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-
-from sqlalchemy import create_engine, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any
+
+from sqlalchemy import Connection, Engine, create_engine, event, text
+from sqlalchemy.engine import ExceptionContext, ExecutionContext
+from sqlalchemy.engine.interfaces import DBAPICursor
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
+from fkg.serialization import loads_json
 from fkg.settings import get_settings
 
+logger = logging.getLogger(__name__)
 
-def get_sync_engine():
-    """Get a synchronous database engine."""
-    settings = get_settings()
-    # Convert async URL to sync URL if needed
-    url = settings.database.url
-    if "+psycopg" in url and "async" not in url:
-        sync_url = url
-    else:
-        sync_url = url.replace("postgresql+asyncpg", "postgresql+psycopg")
-    return create_engine(sync_url, echo=False)
 
+def pool_options() -> dict:
+    """Pool settings shared by the sync and async engines.
 
-def get_async_engine():
-    """Get an async database engine."""
+    The configured pool size is a budget for the whole server, so each API
+    worker process gets its share and the total number of PostgreSQL
+    connections stays the same regardless of worker count. pre_ping
+    transparently replaces connections the server has dropped.
+    """
     settings = get_settings()
-    url = settings.database.url
-    # Convert to asyncpg if using psycopg
-    async_url = url.replace("postgresql+psycopg", "postgresql+asyncpg")
-    return create_async_engine(async_url, echo=False)
+    workers = max(1, settings.api.workers)
+    return {
+        "pool_size": max(1, settings.database.pool_size // workers),
+        "max_overflow": settings.database.max_overflow // workers,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.database.pool_recycle,
+    }
+
+
+# Sync engine and sessionmaker shared by the process. Built lazily on first
+# use, so each forked worker opens its own connections.
+_sync_engine: Engine | None = None
+_sync_sessionmaker: sessionmaker[Session] | None = None
+
+
+def get_sync_engine() -> Engine:
+    """Get the shared synchronous database engine."""
+    global _sync_engine
+    if _sync_engine is None:
+        settings = get_settings()
+        _sync_engine = create_engine(
+            settings.database.sync_url,
+            echo=False,
+            json_deserializer=loads_json,
+            **pool_options(),
+        )
+    return _sync_engine
+
+
+# Async engine and sessionmaker shared by the API (built lazily on first use)
+_async_engine: AsyncEngine | None = None
+_async_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the shared async database engine."""
+    global _async_engine
+    if _async_engine is None:
+        settings = get_settings()
+        _async_engine = create_async_engine(
+            settings.database.async_url,
+            echo=False,
+            json_deserializer=loads_json,
+            **pool_options(),
+        )
+    return _async_engine
 
 
 def get_sync_session() -> Session:
-    """Get a synchronous database session."""
-    engine = get_sync_engine()
-    SessionLocal = sessionmaker(bind=engine)
-    return SessionLocal()
+    """Get a synchronous database session from the shared engine's pool.
+
+    Sessions are context managers: ``with get_sync_session() as session:``.
+    """
+    global _sync_sessionmaker
+    if _sync_sessionmaker is None:
+        _sync_sessionmaker = sessionmaker(
+            bind=get_sync_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _sync_sessionmaker()
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the shared async sessionmaker."""
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(bind=get_async_engine(), expire_on_commit=False)
+    return _async_sessionmaker
+
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session.
 
-async def get_async_session() -> AsyncSession:
-    """Get an async database session."""
-    engine = get_async_engine()
-    AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
-    return AsyncSessionLocal()
+    Intended for use as a FastAPI dependency: ``Depends(get_async_session)``.
+    """
+    async with get_async_sessionmaker()() as session:
+        yield session
 
 
 @asynccontextmanager
 async def async_session_context() -> AsyncGenerator[AsyncSession, None]:
     """Async context manager for database sessions."""
-    session = await get_async_session()
+    session = get_async_sessionmaker()()
     try:
         yield session
         await session.commit()
@@ -59,6 +125,36 @@ async def async_session_context() -> AsyncGenerator[AsyncSession, None]:
         await session.close()
 
 
+def dispose_sync_engine() -> None:
+    """Close the shared sync engine's pooled connections.
+
+    The next call to get_sync_engine() or get_sync_session() builds a new
+    engine. Registered with atexit so CLI runs disconnect cleanly.
+    """
+    global _sync_engine, _sync_sessionmaker
+    if _sync_engine is not None:
+        _sync_engine.dispose()
+    _sync_engine = None
+    _sync_sessionmaker = None
+
+
+atexit.register(dispose_sync_engine)
+
+
+async def dispose_engines() -> None:
+    """Close the pooled connections of both shared engines.
+
+    Called when the API shuts down. Async connections belong to the event
+    loop that opened them, so they must be closed before that loop ends.
+    """
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_sessionmaker = None
+    dispose_sync_engine()
+
+
 def check_database_connection() -> bool:
     """Check if the database connection works."""
     try:
@@ -70,6 +166,16 @@ def check_database_connection() -> bool:
         return False
 
 
+async def check_database_connection_async() -> bool:
+    """Check if the database connection works without blocking the event loop."""
+    try:
+        async with get_async_sessionmaker()() as session:
+            await session.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+
 def init_database() -> None:
     """Initialize the database schema using Alembic."""
     from alembic import command
@@ -90,3 +196,58 @@ def init_database() -> None:
     alembic_cfg.set_main_option("sqlalchemy.url", settings.database.url)
 
     command.upgrade(alembic_cfg, "head")
+
+
+_slow_query_threshold_ms: float | None = None
+
+
+def _start_query_timer(
+    conn: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _log_slow_query(
+    conn: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext | None,
+    executemany: bool,
+) -> None:
+    elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+    if _slow_query_threshold_ms is not None and elapsed_ms >= _slow_query_threshold_ms:
+        logger.warning("Slow query (%.1f ms): %s | params=%r", elapsed_ms, statement, parameters)
+
+
+def _discard_query_timer(exception_context: ExceptionContext) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # time so the stack on a pooled connection does not grow
+    conn = exception_context.connection
+    if conn is not None and exception_context.execution_context is not None:
+        start_times = conn.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
+
+
+def enable_slow_query_logging(threshold_ms: float) -> None:
+    """Log every statement that takes at least ``threshold_ms`` to run.
+
+    Listens on all engines (sync and async). Intended for non-production
+    environments, to catch queries that regress into sequential scans or
+    N+1 patterns. Calling it again only updates the threshold.
+
+    Args:
+        threshold_ms: Minimum duration in milliseconds for a statement to be logged
+    """
+    global _slow_query_threshold_ms
+    _slow_query_threshold_ms = threshold_ms
+    if not event.contains(Engine, "before_cursor_execute", _start_query_timer):
+        event.listen(Engine, "before_cursor_execute", _start_query_timer)
+        event.listen(Engine, "after_cursor_execute", _log_slow_query)
+        event.listen(Engine, "handle_error", _discard_query_timer)
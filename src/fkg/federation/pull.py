@@ -1,26 +1,132 @@
 """Pull PKG from remote federation nodes."""
 
+import atexit
+import importlib.util
+import shutil
 import tempfile
+import threading
 import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
 import httpx
 from sqlalchemy.orm import Session
 
+from fkg.pkg.archive import UnsupportedZipStreamError, ZipStreamError, extract_zip_stream
 from fkg.pkg.import_ import import_pkg
 from fkg.pkg.sign import verify_pkg
 from fkg.settings import RemoteConfig
 
+# Bytes read from the network or an archive entry per write
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Remotes downloaded at the same time by pull_all_remotes()
+MAX_PARALLEL_FETCHES = 8
+
 
 class PullError(Exception):
     """Raised when pull operation fails."""
     pass
 
 
+# HTTP clients shared by all pulls, keyed by whether TLS is verified, so
+# connections (and TLS sessions) to a remote are reused between pulls
+_clients: dict[bool, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(verify_tls: bool = True) -> httpx.Client:
+    """Get the shared HTTP client for remotes with the given TLS setting."""
+    with _clients_lock:
+        client = _clients.get(verify_tls)
+        if client is None:
+            client = httpx.Client(
+                # HTTP/2 needs the h2 package (the httpx[http2] extra)
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(max_keepalive_connections=10),
+                verify=verify_tls,
+            )
+            _clients[verify_tls] = client
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
+
+
+def _extract_zip(zip_path: Path, dest_dir: Path) -> None:
+    """Extract a zip archive entry by entry, streaming each to disk.
+
+    Raises:
+        PullError: If an entry would be written outside ``dest_dir``
+    """
+    root = dest_dir.resolve()
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        for info in zf.infolist():
+            target = (root / info.filename).resolve()
+            if not target.is_relative_to(root):
+                raise PullError(f"PKG archive entry escapes the PKG directory: {info.filename}")
+
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+
+
+def _download(
+    client: httpx.Client, pkg_url: str, consume: Callable[[Iterator[bytes]], object]
+) -> None:
+    """Stream a PKG archive from ``pkg_url`` into ``consume``.
+
+    Raises:
+        PullError: If the request fails or the body is shorter than advertised
+    """
+
+    def body() -> Iterator[bytes]:
+        written = 0
+        for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            yield chunk
+
+        expected = response.headers.get("content-length")
+        if expected is not None and "content-encoding" not in response.headers:
+            if written != int(expected):
+                raise PullError(
+                    f"Truncated PKG from {pkg_url}: got {written} of {expected} bytes"
+                )
+
+    try:
+        with client.stream("GET", pkg_url) as response:
+            response.raise_for_status()
+            chunks = body()
+            consume(chunks)
+            # Drain anything the consumer left unread so the length is checked
+            for _ in chunks:
+                pass
+
+    except httpx.HTTPError as e:
+        raise PullError(f"Failed to fetch PKG from {pkg_url}: {e}")
+
+
 def fetch_remote_pkg(remote: RemoteConfig, output_dir: Path) -> Path:
     """Fetch PKG from a remote endpoint.
 
+    By default the archive is extracted while it downloads, so no copy of
+    the zip is kept on disk. Archives that cannot be read in one pass (or
+    remotes with ``trust.stream_extract`` disabled) are saved to a temporary
+    file first and extracted from there. Either way memory use does not grow
+    with the size of the PKG.
+
     Args:
         remote: Remote configuration
         output_dir: Directory to extract PKG to
@@ -32,27 +138,66 @@ def fetch_remote_pkg(remote: RemoteConfig, output_dir: Path) -> Path:
         PullError: If fetch fails
     """
     pkg_url = f"{remote.endpoint.rstrip('/')}/pkg/latest"
+    pkg_dir = output_dir / "pkg"
+    pkg_dir.mkdir(exist_ok=True)
+
+    client = _get_client(remote.trust.verify_tls)
 
+    if remote.trust.stream_extract:
+        try:
+            _download(client, pkg_url, lambda chunks: extract_zip_stream(chunks, pkg_dir))
+            return pkg_dir
+        except UnsupportedZipStreamError:
+            # Start over and download the archive in full
+            shutil.rmtree(pkg_dir)
+            pkg_dir.mkdir()
+        except ZipStreamError as e:
+            raise PullError(f"Invalid PKG archive from {pkg_url}: {e}")
+
+    # Save zip file
+    zip_path = output_dir / "pkg.zip"
+
+    def save(chunks: Iterator[bytes]) -> None:
+        with open(zip_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    _download(client, pkg_url, save)
+
+    # Extract zip
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.get(pkg_url)
-            response.raise_for_status()
+        _extract_zip(zip_path, pkg_dir)
+    except zipfile.BadZipFile as e:
+        raise PullError(f"Invalid PKG archive from {pkg_url}: {e}")
 
-            # Save zip file
-            zip_path = output_dir / "pkg.zip"
-            zip_path.write_bytes(response.content)
+    return pkg_dir
 
-            # Extract zip
-            pkg_dir = output_dir / "pkg"
-            pkg_dir.mkdir(exist_ok=True)
 
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(pkg_dir)
+def _fetch_verified_pkg(remote: RemoteConfig, output_dir: Path, verify_signatures: bool) -> Path:
+    """Fetch a remote's PKG and check its signature if required."""
+    # Fetch PKG from remote
+    pkg_dir = fetch_remote_pkg(remote, output_dir)
 
-            return pkg_dir
+    # Verify signature if required
+    if verify_signatures:
+        verify_result = verify_pkg(pkg_dir, remote.public_key)
+        if not verify_result.get("valid"):
+            raise PullError(f"Signature verification failed: {verify_result.get('error')}")
 
-    except httpx.HTTPError as e:
-        raise PullError(f"Failed to fetch PKG from {pkg_url}: {e}")
+    return pkg_dir
+
+
+def _import_remote_pkg(session: Session, remote: RemoteConfig, pkg_dir: Path) -> dict[str, Any]:
+    """Import a fetched PKG under the remote's authority ID."""
+    # Import with remote's authority ID
+    # This ensures remote entities are namespaced to the remote
+    return import_pkg(
+        session,
+        pkg_dir,
+        authority=remote.id,
+        verify_checksums_flag=True,
+        validate=True,
+    )
 
 
 def pull_remote(
@@ -78,33 +223,18 @@ def pull_remote(
         verify_signatures = remote.trust.verify_signatures
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-
-        # Fetch PKG from remote
-        pkg_dir = fetch_remote_pkg(remote, tmpdir_path)
-
-        # Verify signature if required
-        if verify_signatures:
-            verify_result = verify_pkg(pkg_dir, remote.public_key)
-            if not verify_result.get("valid"):
-                raise PullError(f"Signature verification failed: {verify_result.get('error')}")
-
-        # Import with remote's authority ID
-        # This ensures remote entities are namespaced to the remote
-        stats = import_pkg(
-            session,
-            pkg_dir,
-            authority=remote.id,
-            verify_checksums_flag=True,
-            validate=True,
-        )
-
-        return stats
+        pkg_dir = _fetch_verified_pkg(remote, Path(tmpdir), verify_signatures)
+        return _import_remote_pkg(session, remote, pkg_dir)
 
 
 def pull_all_remotes(session: Session) -> dict[str, dict[str, Any]]:
     """Pull from all configured remotes.
 
+    Downloads run concurrently (up to MAX_PARALLEL_FETCHES at a time), while
+    imports run one at a time on ``session`` as downloads finish, so each
+    remote is still imported in its own transaction. A failing remote does
+    not stop the others.
+
     Args:
         session: Database session
 
@@ -114,19 +244,36 @@ def pull_all_remotes(session: Session) -> dict[str, dict[str, Any]]:
     from fkg.federation.remotes import get_remote_registry
 
     registry = get_remote_registry()
-    results = {}
-
-    for remote in registry.list():
-        try:
-            stats = pull_remote(session, remote)
-            results[remote.id] = {
-                "success": True,
-                "stats": stats,
-            }
-        except Exception as e:
-            results[remote.id] = {
-                "success": False,
-                "error": str(e),
-            }
-
-    return results
+    remotes = registry.list()
+    results: dict[str, dict[str, Any]] = {}
+    if not remotes:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_FETCHES, len(remotes))) as pool:
+        futures = {}
+        for remote in remotes:
+            tmpdir = tempfile.TemporaryDirectory()
+            future = pool.submit(
+                _fetch_verified_pkg, remote, Path(tmpdir.name), remote.trust.verify_signatures
+            )
+            futures[future] = (remote, tmpdir)
+
+        for future in as_completed(futures):
+            remote, tmpdir = futures[future]
+            try:
+                stats = _import_remote_pkg(session, remote, future.result())
+                results[remote.id] = {
+                    "success": True,
+                    "stats": stats,
+                }
+            except Exception as e:
+                session.rollback()
+                results[remote.id] = {
+                    "success": False,
+                    "error": str(e),
+                }
+            finally:
+                tmpdir.cleanup()
+
+    # Report remotes in configuration order
+    return {remote.id: results[remote.id] for remote in remotes}
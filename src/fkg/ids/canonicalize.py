@@ -3,8 +3,52 @@
 import json
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
+# orjson and json.dumps disagree on some float spellings (1e-05 vs 1e-5,
+# 1e-05 vs 0.00001, NaN vs null). IDs must stay byte-identical, so any
+# output that could contain one of those is re-encoded with json.dumps.
+_ORJSON_MISMATCH_RE = re.compile(rb"e-|0\.0000|null")
+
+
+# Common business suffixes removed by normalize_name(), in the order they are tried
+_SUFFIXES = (
+    r"inc\.?",
+    r"llc\.?",
+    r"corp\.?",
+    r"corporation",
+    r"incorporated",
+    r"ltd\.?",
+    r"limited",
+    r"co\.?",
+    r"company",
+)
+
+# _SUFFIX_RES[i] matches any of _SUFFIXES[i:] at the end of a string, with
+# one group per suffix so match.lastindex tells which one matched
+_SUFFIX_RES = tuple(
+    re.compile(
+        r"\s+(?:" + "|".join(f"({suffix})" for suffix in _SUFFIXES[i:]) + ")$",
+        re.IGNORECASE,
+    )
+    for i in range(len(_SUFFIXES))
+)
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# The ASCII characters _PUNCT_RE removes: string.punctuation except "_"
+# (a word character), DEL, and control characters that are not whitespace
+# (\x1c-\x1f count as whitespace and are kept). ASCII-only names are
+# stripped with bytes.translate, a plain C loop; others use the regex.
+_ASCII_PUNCT = bytes(c for c in range(128) if _PUNCT_RE.match(chr(c)))
+
+# Distinct strings remembered by the normalizers. Ingest sees the same
+# types, jurisdictions and categories on nearly every row.
+NORMALIZE_CACHE_SIZE = 65536
+
 
 def normalize_string(s: str) -> str:
     """Normalize a string for comparison.
@@ -14,10 +58,16 @@ def normalize_string(s: str) -> str:
     - Strip leading/trailing whitespace
     - Collapse internal whitespace
     - Remove punctuation that commonly varies
+
+    Results for string inputs are memoized (see clear_caches).
     """
     if not isinstance(s, str):
         return s
+    return _normalize_string(s)
 
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_string(s: str) -> str:
     # Unicode normalization
     s = unicodedata.normalize("NFKC", s)
 
@@ -37,29 +87,36 @@ def normalize_name(name: str) -> str:
     - All normalize_string operations
     - Remove common suffixes (Inc, LLC, etc.)
     - Remove punctuation
+
+    Results for string inputs are memoized (see clear_caches).
     """
     if not isinstance(name, str):
         return name
-
-    s = normalize_string(name)
-
-    # Remove common business suffixes
-    suffixes = [
-        r"\s+inc\.?$",
-        r"\s+llc\.?$",
-        r"\s+corp\.?$",
-        r"\s+corporation$",
-        r"\s+incorporated$",
-        r"\s+ltd\.?$",
-        r"\s+limited$",
-        r"\s+co\.?$",
-        r"\s+company$",
-    ]
-    for suffix in suffixes:
-        s = re.sub(suffix, "", s, flags=re.IGNORECASE)
+    return _normalize_name(name)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_name(name: str) -> str:
+    s = _normalize_string(name)
+
+    # Remove common business suffixes. Suffixes are stripped in list order,
+    # so after removing one only those later in the list are tried again
+    # ("acme co inc" -> "acme co" -> "acme", but "acme inc co" -> "acme inc").
+    start = 0
+    while start < len(_SUFFIX_RES):
+        match = _SUFFIX_RES[start].search(s)
+        if match is None:
+            break
+        s = s[: match.start()]
+        # Every alternative is a group, so a match always sets lastindex
+        assert match.lastindex is not None
+        start += match.lastindex
 
     # Remove punctuation (keep alphanumeric and spaces)
-    s = re.sub(r"[^\w\s]", "", s)
+    if s.isascii():
+        s = s.encode("ascii").translate(None, _ASCII_PUNCT).decode("ascii")
+    else:
+        s = _PUNCT_RE.sub("", s)
 
     # Final whitespace cleanup
     s = " ".join(s.split())
@@ -67,18 +124,37 @@ def normalize_name(name: str) -> str:
     return s
 
 
-def sort_dict(d: dict[str, Any]) -> dict[str, Any]:
-    """Recursively sort dictionary keys."""
-    result = {}
-    for key in sorted(d.keys()):
-        value = d[key]
-        if isinstance(value, dict):
-            result[key] = sort_dict(value)
-        elif isinstance(value, list):
-            result[key] = [sort_dict(item) if isinstance(item, dict) else item for item in value]
-        else:
-            result[key] = value
-    return result
+def clear_caches() -> None:
+    """Clear the memoized results of normalize_string and normalize_name."""
+    _normalize_string.cache_clear()
+    _normalize_name.cache_clear()
+
+
+# Fields that get aggressive name normalization in canonicalize()
+NAME_FIELDS = frozenset(("name", "organization_name", "service_name"))
+
+
+# Types canonicalize() dispatches on with a plain ``type(value) is ...``
+# check. Anything else (e.g. a str or dict subclass) goes through
+# _container_type() once, so subclasses are still handled like their base.
+_PLAIN_TYPES = frozenset((str, dict, list, int, float, bool, type(None)))
+
+
+def _container_type(value: Any) -> type:
+    if isinstance(value, str):
+        return str
+    if isinstance(value, dict):
+        return dict
+    if isinstance(value, list):
+        return list
+    return type(value)
+
+
+def _attach(parent: dict | list, key: str | None, value: Any) -> None:
+    if isinstance(parent, dict):
+        parent[key] = value
+    else:
+        parent.append(value)
 
 
 def canonicalize(payload: dict[str, Any], normalize_names: bool = True) -> dict[str, Any]:
@@ -91,6 +167,9 @@ def canonicalize(payload: dict[str, Any], normalize_names: bool = True) -> dict[
     - Remove null values
     - Remove empty strings and empty collections
 
+    Nested structures are walked with an explicit stack rather than
+    recursion, so arbitrarily deep payloads cannot hit the recursion limit.
+
     Args:
         payload: The dictionary to canonicalize
         normalize_names: Whether to apply aggressive name normalization
@@ -101,60 +180,121 @@ def canonicalize(payload: dict[str, Any], normalize_names: bool = True) -> dict[
     if not isinstance(payload, dict):
         return payload
 
-    result = {}
-
-    for key in sorted(payload.keys()):
-        value = payload[key]
-
-        # Skip null/None values
-        if value is None:
-            continue
-
-        # Handle nested structures
-        if isinstance(value, dict):
-            canonical_value = canonicalize(value, normalize_names)
-            if canonical_value:  # Skip empty dicts
-                result[key] = canonical_value
-
-        elif isinstance(value, list):
-            # Process list items
-            canonical_list = []
-            for item in value:
-                if isinstance(item, dict):
-                    canonical_item = canonicalize(item, normalize_names)
-                    if canonical_item:
-                        canonical_list.append(canonical_item)
-                elif isinstance(item, str):
-                    normalized = normalize_string(item)
+    result: dict[str, Any] = {}
+
+    # Each frame is (source, pending keys or items, output, parent, key in
+    # parent). A finished frame is attached to its parent only if non-empty;
+    # list frames have no key and are appended instead.
+    stack: list[tuple] = [(payload, iter(sorted(payload)), result, None, None)]
+    push = stack.append
+
+    while stack:
+        source, pending, out, parent, parent_key = stack[-1]
+
+        if type(out) is dict:
+            for key in pending:
+                value = source[key]
+                kind = type(value)
+                if kind not in _PLAIN_TYPES:
+                    kind = _container_type(value)
+
+                # Skip null/None values
+                if value is None:
+                    continue
+
+                if kind is str:
+                    # Apply name normalization for specific fields
+                    if normalize_names and key in NAME_FIELDS:
+                        normalized = _normalize_name(value)
+                    else:
+                        normalized = _normalize_string(value)
+
+                    if normalized:  # Skip empty strings
+                        out[key] = normalized
+
+                # Handle nested structures (resume this frame afterwards)
+                elif kind is dict:
+                    push((value, iter(sorted(value)), {}, out, key))
+                    break
+
+                elif kind is list:
+                    push((value, iter(value), [], out, key))
+                    break
+
+                else:
+                    # Numbers, booleans, etc.
+                    out[key] = value
+            else:
+                stack.pop()
+                if out and parent is not None:
+                    _attach(parent, parent_key, out)
+
+        else:
+            # List items: dicts are canonicalized, strings normalized, and
+            # anything else (including nested lists) kept as-is
+            for item in pending:
+                kind = type(item)
+                if kind not in _PLAIN_TYPES:
+                    kind = _container_type(item)
+
+                if kind is str:
+                    normalized = _normalize_string(item)
                     if normalized:
-                        canonical_list.append(normalized)
+                        out.append(normalized)
+                elif kind is dict:
+                    push((item, iter(sorted(item)), {}, out, None))
+                    break
                 elif item is not None:
-                    canonical_list.append(item)
+                    out.append(item)
+            else:
+                stack.pop()
+                if out:
+                    _attach(parent, parent_key, out)
 
-            if canonical_list:  # Skip empty lists
-                result[key] = canonical_list
+    return result
 
-        elif isinstance(value, str):
-            # Apply name normalization for specific fields
-            if normalize_names and key in ("name", "organization_name", "service_name"):
-                normalized = normalize_name(value)
-            else:
-                normalized = normalize_string(value)
 
-            if normalized:  # Skip empty strings
-                result[key] = normalized
+def _dump_canonical(payload: dict[str, Any]) -> bytes | str:
+    """Serialize the canonical payload: orjson bytes, or a json.dumps str."""
+    canonical = canonicalize(payload)
 
-        else:
-            # Numbers, booleans, etc.
-            result[key] = value
+    try:
+        # Keys are still sorted: dicts nested in lists of lists are kept
+        # as-is by canonicalize()
+        encoded = orjson.dumps(
+            canonical,
+            option=orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    except TypeError:
+        # Non-string keys, integers over 64 bits, surrogates, and types
+        # json.dumps rejects
+        pass
+    else:
+        if not _ORJSON_MISMATCH_RE.search(encoded):
+            return encoded
 
-    return result
+    return json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
 
 
 def canonical_json(payload: dict[str, Any]) -> str:
     """Convert payload to canonical JSON string.
 
     Returns a deterministic JSON representation suitable for hashing.
+    The output is identical to ``json.dumps(canonical, sort_keys=True,
+    separators=(",", ":"), ensure_ascii=False)``; orjson is used when it is
+    guaranteed to produce the same bytes.
     """
-    canonical = canonicalize(payload)
-    return json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    dumped = _dump_canonical(payload)
+    return dumped.decode("utf-8") if isinstance(dumped, bytes) else dumped
+
+
+def canonical_json_bytes(payload: dict[str, Any]) -> bytes:
+    """Convert payload to canonical JSON encoded as UTF-8, for hashing.
+
+    Same as ``canonical_json(payload).encode("utf-8")``, but orjson output
+    is returned as-is instead of being decoded and encoded again.
+    """
+    dumped = _dump_canonical(payload)
+    return dumped if isinstance(dumped, bytes) else dumped.encode("utf-8")
@@ -3,7 +3,7 @@
 import hashlib
 from typing import Any
 
-from fkg.ids.canonicalize import canonical_json, canonicalize
+from fkg.ids.canonicalize import canonical_json_bytes, canonicalize
 
 
 def make_id(namespace: str, entity_type: str, payload: dict[str, Any]) -> str:
@@ -26,10 +26,10 @@ def make_id(namespace: str, entity_type: str, payload: dict[str, Any]) -> str:
     payload_for_hash = {k: v for k, v in payload.items() if k not in ("id", "authority_id")}
 
     # Get canonical JSON
-    canonical = canonical_json(payload_for_hash)
+    canonical = canonical_json_bytes(payload_for_hash)
 
     # Compute SHA256 hash
-    hash_bytes = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    hash_bytes = hashlib.sha256(canonical).hexdigest()
 
     # Use first 16 characters of hash
     short_hash = hash_bytes[:16]
@@ -62,8 +62,8 @@ def make_edge_id(
     if properties:
         payload["properties"] = properties
 
-    canonical = canonical_json(payload)
-    hash_bytes = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    canonical = canonical_json_bytes(payload)
+    hash_bytes = hashlib.sha256(canonical).hexdigest()
     short_hash = hash_bytes[:16]
 
     return f"{namespace}:edge:{short_hash}"
@@ -74,5 +74,5 @@ def compute_content_hash(payload: dict[str, Any]) -> str:
 
     Returns the full SHA256 hash of the canonical payload.
     """
-    canonical = canonical_json(payload)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    canonical = canonical_json_bytes(payload)
+    return hashlib.sha256(canonical).hexdigest()
@@ -0,0 +1,28 @@
+"""Time-ordered UUIDs for surrogate keys."""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> str:
+    """Generate a version 7 UUID (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds and the next 12 the
+    fraction of the millisecond, so IDs sort by creation time to within
+    about 250ns; the remaining 62 bits are random. Rows keyed by them are
+    appended to the right edge of the primary key index instead of landing
+    on random pages as uuid4 keys do.
+
+    Returns:
+        The UUID in canonical string form
+    """
+    timestamp_ms, fraction_ns = divmod(time.time_ns(), 1_000_000)
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (fraction_ns << 12) // 1_000_000 << 64
+        | 0x2 << 62
+        | int.from_bytes(os.urandom(8), "big") >> 2
+    )
+    return str(uuid.UUID(int=value))
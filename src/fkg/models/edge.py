@@ -35,9 +35,20 @@ class Edge(Base):
     )
 
     __table_args__ = (
-        Index("ix_edges_src_type", "src_id", "type"),
-        Index("ix_edges_dst_type", "dst_id", "type"),
+        Index(
+            "ix_edges_src_type_covering",
+            "src_id",
+            "type",
+            postgresql_include=["dst_id", "authority_id"],
+        ),
+        Index(
+            "ix_edges_dst_type_covering",
+            "dst_id",
+            "type",
+            postgresql_include=["src_id", "authority_id"],
+        ),
         Index("ix_edges_authority_type", "authority_id", "type"),
+        Index("ix_edges_created_at_id", "created_at", "id"),
     )
 
     def to_dict(self) -> dict:
@@ -50,8 +61,8 @@ class Edge(Base):
             "schema_version": self.schema_version,
             "authority_id": self.authority_id,
             "data": self.data,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def to_export_dict(self) -> dict:
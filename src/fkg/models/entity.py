@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy import DateTime, Index, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -34,7 +34,18 @@ class Entity(Base):
 
     __table_args__ = (
         Index("ix_entities_type_authority", "type", "authority_id"),
-        Index("ix_entities_data_name", "data", postgresql_using="gin"),
+        Index("ix_entities_created_at_id", "created_at", "id"),
+        Index(
+            "ix_entities_data_gin",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_entities_data_name_trgm",
+            text("(data ->> 'name') gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     def to_dict(self) -> dict:
@@ -45,8 +56,8 @@ class Entity(Base):
             "schema_version": self.schema_version,
             "authority_id": self.authority_id,
             "data": self.data,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def to_export_dict(self) -> dict:
@@ -32,7 +32,7 @@ class Event(Base):
             "event_type": self.event_type,
             "authority_id": self.authority_id,
             "payload": self.payload,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
 
     def to_export_dict(self) -> dict:
@@ -1,12 +1,12 @@
 """Evidence model for provenance tracking."""
 
 from datetime import datetime
-from uuid import uuid4
 
 from sqlalchemy import DateTime, Float, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from fkg.ids.uuid7 import uuid7
 from fkg.models.base import Base
 
 
@@ -19,9 +19,8 @@ class Evidence(Base):
 
     __tablename__ = "evidence"
 
-    id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4())
-    )
+    # Time-ordered so new rows append to the primary key index
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=uuid7)
     entity_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     source_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
     confidence: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
@@ -37,6 +36,6 @@ class Evidence(Base):
             "entity_id": self.entity_id,
             "source_id": self.source_id,
             "confidence": self.confidence,
-            "extracted_at": self.extracted_at.isoformat() if self.extracted_at else None,
+            "extracted_at": self.extracted_at,
             "notes": self.notes,
         }
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,12 +23,14 @@ class Source(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (Index("ix_sources_created_at_id", "created_at", "id"),)
+
     def to_dict(self) -> dict:
         """Convert source to dictionary for API responses."""
         return {
             "id": self.id,
             "data": self.data,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
 
     def to_export_dict(self) -> dict:
@@ -0,0 +1,336 @@
+"""Streaming zip archives for PKG downloads."""
+
+from __future__ import annotations
+
+import queue
+import struct
+import threading
+import zipfile
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fkg.pkg.export import PkgWriter
+
+if TYPE_CHECKING:
+    from zlib import _Decompress
+
+# Compressed bytes gathered before a chunk is handed to the consumer
+CHUNK_SIZE = 64 * 1024
+
+# Chunks the producer may run ahead of the consumer
+MAX_PENDING_CHUNKS = 16
+
+_DONE = object()
+
+
+class _CancelledError(Exception):
+    """Raised inside the producer when the consumer stops reading."""
+
+
+class _QueueSink:
+    """Write-only file object that hands zip output to a queue in chunks.
+
+    It deliberately has no ``seek``/``tell``, so ``zipfile`` treats it as an
+    unseekable stream and writes data descriptors instead of seeking back to
+    patch local headers.
+    """
+
+    def __init__(
+        self, chunks: queue.Queue[object], cancelled: threading.Event, chunk_size: int
+    ):
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        # Set once the producer is finished; later writes (e.g. from
+        # ZipFile.__del__ after a failure) are dropped
+        self.discard = False
+
+    def write(self, data: bytes) -> int:
+        if self.discard:
+            return len(data)
+        self._buffer += data
+        if len(self._buffer) >= self._chunk_size:
+            self.flush()
+        return len(data)
+
+    def flush(self) -> None:
+        if self._buffer and not self.discard:
+            self.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def close(self) -> None:
+        # ZipFile never closes a file object it was given; this completes the
+        # writable file interface it expects
+        self.flush()
+
+    def put(self, item: object) -> None:
+        # Wake up periodically so an abandoned download stops the producer
+        while True:
+            if self._cancelled.is_set():
+                raise _CancelledError()
+            try:
+                self._chunks.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+
+def stream_zip(
+    produce: Callable[[PkgWriter], None],
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield a deflated zip archive as ``produce`` writes files into it.
+
+    ``produce`` runs in a background thread and receives a PkgWriter; each
+    file it writes is compressed straight into the stream. At most
+    MAX_PENDING_CHUNKS chunks are buffered, so memory stays bounded however
+    large the archive is. If the consumer stops iterating (e.g. the client
+    disconnects), the producer is interrupted at its next write.
+
+    Args:
+        produce: Callable that writes the archive's files through the writer
+        chunk_size: Approximate size of each yielded chunk
+
+    Yields:
+        Consecutive pieces of the zip file
+
+    Raises:
+        Exception: Whatever ``produce`` raised, re-raised in the consumer
+    """
+    # bytes chunks, then _DONE or the exception the producer raised
+    chunks: queue.Queue[object] = queue.Queue(maxsize=MAX_PENDING_CHUNKS)
+    cancelled = threading.Event()
+    sink = _QueueSink(chunks, cancelled, chunk_size)
+
+    def write(arcname: str, data: Iterable[bytes]) -> None:
+        with zf.open(arcname, "w", force_zip64=True) as dst:
+            for block in data:
+                dst.write(block)
+
+    def run() -> None:
+        try:
+            produce(write)
+            zf.close()
+            sink.flush()
+            sink.put(_DONE)
+        except _CancelledError:
+            pass
+        except BaseException as e:
+            try:
+                sink.put(e)
+            except _CancelledError:
+                pass
+        finally:
+            sink.discard = True
+
+    zf = zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED)
+    producer = threading.Thread(target=run, name="pkg-zip-stream", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = chunks.get()
+            if isinstance(item, bytes):
+                yield item
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                # _DONE: the archive is complete
+                break
+    finally:
+        # Stops the producer at its next write if it has not finished
+        cancelled.set()
+
+
+class ZipStreamError(Exception):
+    """Raised when a zip stream is corrupt or cannot be read in one pass."""
+
+
+class UnsupportedZipStreamError(ZipStreamError):
+    """Raised for valid archives that need seeking to read.
+
+    Stored (uncompressed) entries whose sizes only appear after the data
+    cannot be delimited without the central directory.
+    """
+
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+_ZIP64_EXTRA_ID = 0x0001
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+
+
+class _ChunkReader:
+    """Reads exact byte counts from an iterable of chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read_some(self) -> bytes:
+        """Return whatever is buffered, or the next chunk (b"" at the end)."""
+        if self._buffer:
+            data, self._buffer = self._buffer, b""
+            return data
+        return next(self._chunks, b"")
+
+    def read_exact(self, size: int) -> bytes:
+        parts = []
+        while size > 0:
+            data = self.read_some()
+            if not data:
+                raise ZipStreamError("Zip stream ended unexpectedly")
+            if len(data) > size:
+                self.unread(data[size:])
+                data = data[:size]
+            parts.append(data)
+            size -= len(data)
+        return b"".join(parts)
+
+    def unread(self, data: bytes) -> None:
+        self._buffer = data + self._buffer
+
+
+def _zip64_sizes(extra: bytes) -> tuple[int, int] | None:
+    """Return (uncompressed, compressed) sizes from a zip64 extra field."""
+    offset = 0
+    while offset + 4 <= len(extra):
+        field_id, size = struct.unpack_from("<2H", extra, offset)
+        if field_id == _ZIP64_EXTRA_ID and size >= 16:
+            return struct.unpack_from("<2Q", extra, offset + 4)
+        offset += 4 + size
+    return None
+
+
+def _inflate(decompressor: _Decompress, data: bytes) -> Iterator[bytes]:
+    """Decompress ``data`` in pieces of at most CHUNK_SIZE bytes.
+
+    Bounding each call keeps a small, highly compressed chunk from
+    expanding into one huge bytes object.
+    """
+    while True:
+        piece = decompressor.decompress(data, CHUNK_SIZE)
+        if piece:
+            yield piece
+        data = decompressor.unconsumed_tail
+        # A full piece may leave output pending even once all input is consumed
+        if decompressor.eof or (not data and len(piece) < CHUNK_SIZE):
+            return
+
+
+def extract_zip_stream(chunks: Iterable[bytes], dest_dir: Path) -> list[str]:
+    """Extract a zip archive while it is still arriving.
+
+    Entries are read in order from their local headers, so nothing is
+    buffered beyond the current chunk and no temporary zip file is needed.
+    Deflated entries written with data descriptors (as stream_zip produces)
+    are delimited by the end of their deflate stream. Output is inflated at
+    most CHUNK_SIZE bytes at a time, so memory stays bounded however much an
+    entry expands. CRCs are checked.
+
+    Args:
+        chunks: The archive's bytes, in order
+        dest_dir: Directory to extract into
+
+    Returns:
+        Names of the extracted entries
+
+    Raises:
+        UnsupportedZipStreamError: If an entry can only be read with seeking
+        ZipStreamError: If the archive is corrupt or an entry would be
+            written outside ``dest_dir``
+    """
+    reader = _ChunkReader(chunks)
+    root = dest_dir.resolve()
+    names = []
+
+    while True:
+        header = reader.read_exact(4)
+        if header != _LOCAL_SIGNATURE:
+            if header.startswith(b"PK"):
+                # Central directory: every entry has been read
+                break
+            raise ZipStreamError("Invalid zip stream: bad local header signature")
+
+        header += reader.read_exact(_LOCAL_HEADER.size - 4)
+        fields = _LOCAL_HEADER.unpack(header)
+        flags, method, crc, compressed_size = fields[2], fields[3], fields[6], fields[7]
+        name_length, extra_length = fields[9], fields[10]
+        raw_name = reader.read_exact(name_length)
+        extra = reader.read_exact(extra_length)
+        name = raw_name.decode("utf-8" if flags & _FLAG_UTF8 else "cp437")
+        zip64 = _zip64_sizes(extra)
+
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise UnsupportedZipStreamError(f"Unsupported compression method {method} for {name}")
+        streamed = bool(flags & _FLAG_DATA_DESCRIPTOR)
+        if streamed and method == zipfile.ZIP_STORED:
+            raise UnsupportedZipStreamError(f"Stored entry with data descriptor: {name}")
+        if not streamed and zip64 is not None and compressed_size == 0xFFFFFFFF:
+            compressed_size = zip64[1]
+
+        target = (root / name).resolve()
+        if not target.is_relative_to(root):
+            raise ZipStreamError(f"Zip entry escapes the target directory: {name}")
+
+        if name.endswith("/"):
+            target.mkdir(parents=True, exist_ok=True)
+            out = None
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            out = open(target, "wb")
+
+        actual_crc = 0
+        try:
+            if streamed:
+                # The deflate stream marks its own end; the rest is unread
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                while not decompressor.eof:
+                    data = reader.read_some()
+                    if not data:
+                        raise ZipStreamError(f"Zip stream ended inside {name}")
+                    for piece in _inflate(decompressor, data):
+                        actual_crc = zlib.crc32(piece, actual_crc)
+                        if out:
+                            out.write(piece)
+                reader.unread(decompressor.unused_data)
+            else:
+                sized_decompressor: _Decompress | None = (
+                    zlib.decompressobj(-zlib.MAX_WBITS) if method == zipfile.ZIP_DEFLATED else None
+                )
+                remaining = compressed_size
+                while remaining:
+                    data = reader.read_some()
+                    if not data:
+                        raise ZipStreamError(f"Zip stream ended inside {name}")
+                    if len(data) > remaining:
+                        reader.unread(data[remaining:])
+                        data = data[:remaining]
+                    remaining -= len(data)
+                    pieces = _inflate(sized_decompressor, data) if sized_decompressor else (data,)
+                    for piece in pieces:
+                        actual_crc = zlib.crc32(piece, actual_crc)
+                        if out:
+                            out.write(piece)
+        finally:
+            if out:
+                out.close()
+
+        if streamed:
+            descriptor = reader.read_exact(4)
+            if descriptor == _DESCRIPTOR_SIGNATURE:
+                descriptor = reader.read_exact(4)
+            crc = struct.unpack("<L", descriptor)[0]
+            # Sizes are 8 bytes each for zip64 entries, else 4
+            reader.read_exact(16 if zip64 is not None else 8)
+
+        if actual_crc != crc:
+            raise ZipStreamError(f"Bad CRC-32 for {name}")
+        names.append(name)
+
+    return names
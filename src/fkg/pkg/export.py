@@ -1,123 +1,269 @@
 """PKG export functionality."""
 
+import hashlib
 import json
+import zlib
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Result, Select, select
 from sqlalchemy.orm import Session
 
-from fkg.changelog.append import get_events_for_export
+from fkg.changelog.append import EXPORT_BATCH_SIZE
 from fkg.models.edge import Edge
 from fkg.models.entity import Entity
+from fkg.models.event import Event
 from fkg.models.source import Source
-from fkg.pkg.manifest import create_manifest, save_manifest
+from fkg.pkg.manifest import create_manifest
+from fkg.serialization import dumps_json
 from fkg.settings import get_settings
 
+# Approximate size of the blocks of JSONL lines handed to a PkgWriter
+JSONL_BLOCK_SIZE = 64 * 1024
 
-def export_entities(session: Session, output_path: Path, authority_id: str | None = None) -> int:
-    """Export entities to JSONL file.
+# gzip level used for compressed exports (favours speed over ratio)
+COMPRESS_LEVEL = 3
+
+# Receives each PKG file as (arcname, chunks of bytes) and stores it somewhere
+PkgWriter = Callable[[str, Iterable[bytes]], None]
+
+
+def directory_writer(output_dir: Path) -> PkgWriter:
+    """Create a PkgWriter that writes files under a directory.
+
+    Args:
+        output_dir: Directory to write into (created if missing)
+
+    Returns:
+        The writer
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def write(arcname: str, chunks: Iterable[bytes]) -> None:
+        path = output_dir / arcname
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    return write
+
+
+def _stream_rows(session: Session, stmt: Select[Any], batch_size: int) -> Result[Any]:
+    """Execute ``stmt`` through a server-side cursor, ``batch_size`` rows at a time."""
+    return session.execute(stmt.execution_options(stream_results=True, yield_per=batch_size))
+
+
+def iter_entities(
+    session: Session,
+    authority_id: str | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Yield entity export records in ID order.
+
+    Columns are selected directly rather than loading Entity objects, and
+    rows are streamed in batches, so memory stays bounded however many
+    entities are exported. Records match Entity.to_export_dict().
 
     Args:
         session: Database session
-        output_path: Path to output file
         authority_id: Optional authority filter
+        batch_size: Number of rows fetched per round trip
 
-    Returns:
-        Number of entities exported
+    Yields:
+        Export dicts for each entity
     """
-    stmt = select(Entity)
+    stmt = select(
+        Entity.id, Entity.type, Entity.schema_version, Entity.authority_id, Entity.data
+    )
     if authority_id:
         stmt = stmt.where(Entity.authority_id == authority_id)
     stmt = stmt.order_by(Entity.id)
 
-    count = 0
-    with open(output_path, "w") as f:
-        for entity in session.execute(stmt).scalars():
-            f.write(json.dumps(entity.to_export_dict()) + "\n")
-            count += 1
+    for row in _stream_rows(session, stmt, batch_size):
+        yield {
+            "id": row.id,
+            "type": row.type,
+            "schema_version": row.schema_version,
+            "authority_id": row.authority_id,
+            **row.data,
+        }
 
-    return count
 
+def iter_edges(
+    session: Session,
+    authority_id: str | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Yield edge export records in ID order.
 
-def export_edges(session: Session, output_path: Path, authority_id: str | None = None) -> int:
-    """Export edges to JSONL file.
+    Streamed as in iter_entities(); records match Edge.to_export_dict().
 
     Args:
         session: Database session
-        output_path: Path to output file
         authority_id: Optional authority filter
+        batch_size: Number of rows fetched per round trip
 
-    Returns:
-        Number of edges exported
+    Yields:
+        Export dicts for each edge
     """
-    stmt = select(Edge)
+    stmt = select(
+        Edge.id,
+        Edge.type,
+        Edge.src_id,
+        Edge.dst_id,
+        Edge.schema_version,
+        Edge.authority_id,
+        Edge.data,
+    )
     if authority_id:
         stmt = stmt.where(Edge.authority_id == authority_id)
     stmt = stmt.order_by(Edge.id)
 
-    count = 0
-    with open(output_path, "w") as f:
-        for edge in session.execute(stmt).scalars():
-            f.write(json.dumps(edge.to_export_dict()) + "\n")
-            count += 1
+    for row in _stream_rows(session, stmt, batch_size):
+        yield {
+            "id": row.id,
+            "type": row.type,
+            "src_id": row.src_id,
+            "dst_id": row.dst_id,
+            "schema_version": row.schema_version,
+            "authority_id": row.authority_id,
+            "properties": row.data.get("properties", {}),
+        }
 
-    return count
 
+def iter_sources(
+    session: Session, batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Yield source export records in ID order.
 
-def export_sources(session: Session, output_path: Path) -> int:
-    """Export sources to JSONL file.
+    Streamed as in iter_entities(); records match Source.to_export_dict().
 
     Args:
         session: Database session
-        output_path: Path to output file
+        batch_size: Number of rows fetched per round trip
 
-    Returns:
-        Number of sources exported
+    Yields:
+        Export dicts for each source
     """
-    stmt = select(Source).order_by(Source.id)
+    stmt = select(Source.id, Source.data).order_by(Source.id)
 
-    count = 0
-    with open(output_path, "w") as f:
-        for source in session.execute(stmt).scalars():
-            f.write(json.dumps(source.to_export_dict()) + "\n")
-            count += 1
+    for row in _stream_rows(session, stmt, batch_size):
+        yield {"id": row.id, **row.data}
 
-    return count
 
+def iter_changelog(
+    session: Session,
+    authority_id: str | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Yield changelog export records in sequence order.
 
-def export_changelog(session: Session, output_path: Path, authority_id: str | None = None) -> int:
-    """Export changelog to JSONL file.
+    Streamed as in iter_entities(). ``created_at`` is left as a datetime
+    for the JSONL writer to format, so records serialize exactly as
+    Event.to_export_dict() does.
 
     Args:
         session: Database session
-        output_path: Path to output file
         authority_id: Optional authority filter
+        batch_size: Number of rows fetched per round trip
+
+    Yields:
+        Export dicts for each event
+    """
+    stmt = select(
+        Event.seq, Event.event_type, Event.authority_id, Event.payload, Event.created_at
+    ).order_by(Event.seq.asc())
+    if authority_id:
+        stmt = stmt.where(Event.authority_id == authority_id)
+
+    for row in _stream_rows(session, stmt, batch_size):
+        yield {
+            "seq": row.seq,
+            "event_type": row.event_type,
+            "authority_id": row.authority_id,
+            "payload": row.payload,
+            "created_at": row.created_at,
+        }
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into a single gzip member."""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def write_jsonl(
+    writer: PkgWriter,
+    filename: str,
+    records: Iterable[dict[str, Any]],
+    compress: bool = False,
+) -> tuple[int, str]:
+    """Write records as JSONL through a writer, hashing as they stream.
+
+    Lines are handed to the writer in blocks of about JSONL_BLOCK_SIZE
+    bytes rather than one at a time.
+
+    Args:
+        writer: Destination for the file
+        filename: Name of the file within the PKG
+        records: Records to serialize, one per line
+        compress: Whether to gzip the file; the checksum is then of the
+            compressed bytes
 
     Returns:
-        Number of events exported
+        Tuple of (number of records written, SHA256 hex digest of the file)
     """
-    events = get_events_for_export(session, authority_id)
+    digest = hashlib.sha256()
+    count = 0
 
-    with open(output_path, "w") as f:
-        for event in events:
-            f.write(json.dumps(event.to_export_dict()) + "\n")
+    def blocks() -> Iterator[bytes]:
+        nonlocal count
+        block = bytearray()
+        for record in records:
+            block += dumps_json(record)
+            block += b"\n"
+            count += 1
+            if len(block) >= JSONL_BLOCK_SIZE:
+                yield bytes(block)
+                block.clear()
 
-    return len(events)
+        if block:
+            yield bytes(block)
+
+    def hashed(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            digest.update(chunk)
+            yield chunk
+
+    chunks = _gzip_chunks(blocks()) if compress else blocks()
+    writer(filename, hashed(chunks))
+    return count, digest.hexdigest()
 
 
 def export_pkg(
     session: Session,
-    output_dir: Path,
+    output: Path | PkgWriter,
     authority_id: str | None = None,
     include_changelog: bool = True,
-) -> dict:
-    """Export a complete PKG to a directory.
+    compress: bool = False,
+) -> dict[str, Any]:
+    """Export a complete PKG.
+
+    Files are streamed straight to ``output`` and checksummed on the way,
+    so nothing is read back after it is written.
 
     Args:
         session: Database session
-        output_dir: Directory to export to
+        output: Directory to export to, or a PkgWriter (e.g. a zip stream)
         authority_id: Optional authority filter (defaults to local instance)
         include_changelog: Whether to include the changelog
+        compress: Whether to gzip the data files (named ``*.jsonl.gz``)
 
     Returns:
         Export statistics
@@ -127,36 +273,44 @@ def export_pkg(
         settings = get_settings()
         authority_id = settings.instance.id
 
-    # Create output directory
-    output_dir.mkdir(parents=True, exist_ok=True)
+    writer = directory_writer(output) if isinstance(output, Path) else output
+    checksums: dict[str, str] = {}
+    suffix = ".jsonl.gz" if compress else ".jsonl"
+
+    def write(name: str, records: Iterable[dict[str, Any]]) -> int:
+        filename = name + suffix
+        count, checksums[filename] = write_jsonl(writer, filename, records, compress)
+        return count
 
     # Export data files
-    entity_count = export_entities(session, output_dir / "entities.jsonl", authority_id)
-    edge_count = export_edges(session, output_dir / "edges.jsonl", authority_id)
-    source_count = export_sources(session, output_dir / "sources.jsonl")
+    entity_count = write("entities", iter_entities(session, authority_id))
+    edge_count = write("edges", iter_edges(session, authority_id))
+    source_count = write("sources", iter_sources(session))
 
     changelog_count = 0
     if include_changelog:
-        changelog_count = export_changelog(session, output_dir / "changelog.jsonl", authority_id)
+        changelog_count = write("changelog", iter_changelog(session, authority_id))
 
-    # Create and save manifest
+    # Create and write manifest
     manifest = create_manifest(
-        output_dir,
+        None,
         entity_count=entity_count,
         edge_count=edge_count,
         source_count=source_count,
         include_changelog=include_changelog,
+        checksums=checksums,
+        compressed=compress,
     )
-    save_manifest(manifest, output_dir)
+    writer("manifest.json", [json.dumps(manifest, indent=2).encode("utf-8")])
 
-    # Create signatures directory (stub for v0.1)
-    signatures_dir = output_dir / "signatures"
-    signatures_dir.mkdir(exist_ok=True)
+    if isinstance(output, Path):
+        # Create signatures directory (stub for v0.1)
+        (output / "signatures").mkdir(exist_ok=True)
 
     return {
         "entities": entity_count,
         "edges": edge_count,
         "sources": source_count,
         "changelog": changelog_count,
-        "manifest": str(output_dir / "manifest.json"),
+        "manifest": str(output / "manifest.json") if isinstance(output, Path) else "manifest.json",
     }
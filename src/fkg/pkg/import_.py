@@ -1,6 +1,7 @@
 """PKG import functionality."""
 
-import json
+import gzip
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -10,27 +11,82 @@ from fkg.pkg.manifest import load_manifest, verify_checksums
 from fkg.storage.edges import EdgeStorage
 from fkg.storage.entities import EntityStorage
 from fkg.storage.sources import SourceStorage
+from fkg.serialization import loads_json
 from fkg.settings import get_settings
 
 
+# Records written per multi-row upsert when importing entities and edges
+IMPORT_BATCH_SIZE = 1000
+
+
 class ImportError(Exception):
     """Raised when PKG import fails."""
     pass
 
 
+def _read_records(input_path: Path) -> Iterator[Any]:
+    """Yield the records of a JSONL file, skipping blank lines.
+
+    Files ending in ``.gz`` (from compressed exports) are decompressed as
+    they are read.
+    """
+    opener = gzip.open if input_path.suffix == ".gz" else open
+    with opener(input_path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield loads_json(line)
+
+
+def _read_batches(
+    input_path: Path, batch_size: int
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Read JSONL records in file order, grouped for upsert_many().
+
+    Each batch holds at most ``batch_size`` consecutive records that share
+    a schema version.
+
+    Yields:
+        Tuples of (schema version, records)
+    """
+    batch: list[dict[str, Any]] = []
+    schema_version: str | None = None
+
+    for data in _read_records(input_path):
+        record_version = data.get("schema_version", "v0.1")
+
+        # A non-empty batch always has its version set; the check narrows it
+        if batch and schema_version is not None and (
+            record_version != schema_version or len(batch) >= batch_size
+        ):
+            yield schema_version, batch
+            batch = []
+        schema_version = record_version
+        batch.append(data)
+
+    if batch and schema_version is not None:
+        yield schema_version, batch
+
+
 def import_entities(
     session: Session,
     input_path: Path,
     authority_id: str,
     validate: bool = True,
+    batch_size: int = IMPORT_BATCH_SIZE,
 ) -> int:
     """Import entities from JSONL file.
 
+    Entities are written ``batch_size`` at a time: each batch and its
+    changelog events are loaded with COPY and merged in one upsert, rather
+    than a lookup and write per entity.
+
     Args:
         session: Database session
         input_path: Path to JSONL file
         authority_id: Authority ID to assign to imported entities
         validate: Whether to validate against schema
+        batch_size: Maximum entities per upsert statement
 
     Returns:
         Number of entities imported
@@ -38,24 +94,16 @@ def import_entities(
     storage = EntityStorage(session)
     count = 0
 
-    with open(input_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            data = json.loads(line)
-
-            # Use the authority_id from import, not from the data
-            storage.upsert(
-                data=data,
-                entity_type=data.get("type"),
-                authority_id=authority_id,
-                schema_version=data.get("schema_version", "v0.1"),
-                validate=validate,
-                log_event=True,
-            )
-            count += 1
+    for schema_version, batch in _read_batches(input_path, batch_size):
+        # Use the authority_id from import, not from the data
+        count += storage.upsert_many(
+            batch,
+            authority_id=authority_id,
+            schema_version=schema_version,
+            validate=validate,
+            log_event=True,
+            copy=True,
+        )
 
     return count
 
@@ -65,14 +113,18 @@ def import_edges(
     input_path: Path,
     authority_id: str,
     validate: bool = True,
+    batch_size: int = IMPORT_BATCH_SIZE,
 ) -> int:
     """Import edges from JSONL file.
 
+    Edges are written in batches, as in import_entities().
+
     Args:
         session: Database session
         input_path: Path to JSONL file
         authority_id: Authority ID to assign to imported edges
         validate: Whether to validate against schema
+        batch_size: Maximum edges per upsert statement
 
     Returns:
         Number of edges imported
@@ -80,22 +132,15 @@ def import_edges(
     storage = EdgeStorage(session)
     count = 0
 
-    with open(input_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            data = json.loads(line)
-
-            storage.upsert(
-                data=data,
-                authority_id=authority_id,
-                schema_version=data.get("schema_version", "v0.1"),
-                validate=validate,
-                log_event=True,
-            )
-            count += 1
+    for schema_version, batch in _read_batches(input_path, batch_size):
+        count += storage.upsert_many(
+            batch,
+            authority_id=authority_id,
+            schema_version=schema_version,
+            validate=validate,
+            log_event=True,
+            copy=True,
+        )
 
     return count
 
@@ -113,15 +158,9 @@ def import_sources(session: Session, input_path: Path) -> int:
     storage = SourceStorage(session)
     count = 0
 
-    with open(input_path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            data = json.loads(line)
-            storage.upsert_source(data)
-            count += 1
+    for data in _read_records(input_path):
+        storage.upsert_source(data)
+        count += 1
 
     return count
 
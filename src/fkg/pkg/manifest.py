@@ -2,6 +2,8 @@
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -9,6 +11,9 @@ from typing import Any
 from fkg.settings import get_settings
 from fkg.validate.validate import validate_manifest
 
+# Bytes read from disk per hash update when checksumming PKG files
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
 
 def compute_file_checksum(path: Path) -> str:
     """Compute SHA256 checksum of a file.
@@ -20,32 +25,59 @@ def compute_file_checksum(path: Path) -> str:
         Hex-encoded SHA256 checksum
     """
     sha256_hash = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(chunk)
+    # Read into one reused buffer; hashlib releases the GIL for large updates
+    buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            sha256_hash.update(view[:size])
     return sha256_hash.hexdigest()
 
 
+def compute_file_checksums(paths: list[Path]) -> list[str]:
+    """Compute SHA256 checksums of several files concurrently.
+
+    hashlib releases the GIL while hashing, so each file is hashed in its
+    own thread (up to one per CPU).
+
+    Args:
+        paths: Paths to the files
+
+    Returns:
+        Hex-encoded SHA256 checksums, in the same order as ``paths``
+    """
+    if len(paths) <= 1:
+        return [compute_file_checksum(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+        return list(executor.map(compute_file_checksum, paths))
+
+
 def create_manifest(
-    output_dir: Path,
+    output_dir: Path | None,
     entity_count: int,
     edge_count: int,
     source_count: int,
     include_changelog: bool = False,
+    checksums: dict[str, str] | None = None,
+    compressed: bool = False,
 ) -> dict[str, Any]:
     """Create a PKG manifest.
 
     Args:
-        output_dir: Directory containing the PKG files
+        output_dir: Directory containing the PKG files (unused if checksums given)
         entity_count: Number of entities in the PKG
         edge_count: Number of edges in the PKG
         source_count: Number of sources in the PKG
         include_changelog: Whether changelog is included
+        checksums: Precomputed SHA256 checksums by filename
+        compressed: Whether the data files are gzipped (``*.jsonl.gz``)
 
     Returns:
         The manifest dictionary
     """
     settings = get_settings()
+    suffix = ".jsonl.gz" if compressed else ".jsonl"
 
     manifest = {
         "version": "0.1",
@@ -60,21 +92,31 @@ def create_manifest(
             "sources": source_count,
         },
         "files": {
-            "entities": "entities.jsonl",
-            "edges": "edges.jsonl",
-            "sources": "sources.jsonl",
+            "entities": f"entities{suffix}",
+            "edges": f"edges{suffix}",
+            "sources": f"sources{suffix}",
         },
         "checksums": {},
     }
 
     if include_changelog:
-        manifest["files"]["changelog"] = "changelog.jsonl"
+        manifest["files"]["changelog"] = f"changelog{suffix}"
+
+    if checksums is not None:
+        manifest["checksums"] = {
+            filename: checksums[filename]
+            for filename in manifest["files"].values()
+            if filename in checksums
+        }
+        return manifest
 
     # Compute checksums for all files
-    for file_key, filename in manifest["files"].items():
-        file_path = output_dir / filename
-        if file_path.exists():
-            manifest["checksums"][filename] = compute_file_checksum(file_path)
+    filenames = [
+        filename for filename in manifest["files"].values() if (output_dir / filename).exists()
+    ]
+    manifest["checksums"] = dict(
+        zip(filenames, compute_file_checksums([output_dir / name for name in filenames]))
+    )
 
     return manifest
 
@@ -134,14 +176,14 @@ def verify_checksums(pkg_dir: Path, manifest: dict[str, Any]) -> list[str]:
     mismatches = []
     checksums = manifest.get("checksums", {})
 
+    # Hash every file that exists at once, then report in manifest order
+    present = [filename for filename in checksums if (pkg_dir / filename).exists()]
+    actual = dict(zip(present, compute_file_checksums([pkg_dir / name for name in present])))
+
     for filename, expected_checksum in checksums.items():
-        file_path = pkg_dir / filename
-        if not file_path.exists():
+        if filename not in actual:
             mismatches.append(f"{filename}: file missing")
-            continue
-
-        actual_checksum = compute_file_checksum(file_path)
-        if actual_checksum != expected_checksum:
+        elif actual[filename] != expected_checksum:
             mismatches.append(f"{filename}: checksum mismatch")
 
     return mismatches
@@ -3,6 +3,15 @@
 from dataclasses import dataclass
 from typing import Any
 
+# Reliability weight per source type (others get 0.5)
+_SOURCE_WEIGHTS = {
+    "api": 0.9,
+    "dataset": 0.9,
+    "url": 0.7,
+    "file": 0.7,
+    "manual": 0.8,
+}
+
 
 @dataclass
 class ProvenanceScore:
@@ -36,19 +45,21 @@ def calculate_confidence(evidence_records: list[dict[str, Any]]) -> ProvenanceSc
             recency_days=None,
         )
 
-    # Calculate average confidence
-    confidences = [e.get("confidence", 1.0) for e in evidence_records]
-    avg_confidence = sum(confidences) / len(confidences)
-
-    # Gather source types
-    source_types = set()
+    # Average confidence and source types, in one pass over the evidence
+    total_confidence = 0
+    source_types: set[str] = set()
     for e in evidence_records:
-        source = e.get("source", {})
+        total_confidence += e.get("confidence", 1.0)
+
+        source = e.get("source")
         if isinstance(source, dict):
-            source_type = source.get("data", {}).get("type") or source.get("type")
+            data = source.get("data")
+            source_type = (data.get("type") if data is not None else None) or source.get("type")
             if source_type:
                 source_types.add(source_type)
 
+    avg_confidence = total_confidence / len(evidence_records)
+
     # Diversity bonus: up to 0.1 bonus for having multiple source types
     diversity_bonus = min(0.1, (len(source_types) - 1) * 0.05) if len(source_types) > 1 else 0
 
@@ -75,11 +86,4 @@ def get_source_weight(source_type: str) -> float:
     Returns:
         Weight multiplier (0.0 - 1.0)
     """
-    weights = {
-        "api": 0.9,
-        "dataset": 0.9,
-        "url": 0.7,
-        "file": 0.7,
-        "manual": 0.8,
-    }
-    return weights.get(source_type, 0.5)
+    return _SOURCE_WEIGHTS.get(source_type, 0.5)
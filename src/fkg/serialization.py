@@ -0,0 +1,71 @@
+"""Fast JSON encoding and decoding that match the standard library."""
+
+import json
+import re
+from datetime import date, datetime, time
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+# orjson decodes integers outside the 64-bit range as floats rather than
+# failing, so anything with a run of 19+ digits is left to json
+_WIDE_INT_BYTES_RE = re.compile(rb"\d{19}")
+_WIDE_INT_STR_RE = re.compile(r"\d{19}")
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Decode JSON with orjson where it gives the same result as json.loads.
+
+    Input orjson rejects (NaN/Infinity, numbers that overflow a double) or
+    may decode differently (integers wider than 64 bits) is decoded with
+    json instead.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        The decoded value
+    """
+    if isinstance(data, str):
+        has_wide_int = _WIDE_INT_STR_RE.search(data) is not None
+    else:
+        has_wide_int = _WIDE_INT_BYTES_RE.search(data) is not None
+    if not has_wide_int:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps default: the types orjson encodes natively, written the same way."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(value: Any, option: int = 0) -> bytes:
+    """Encode JSON as compact UTF-8 with orjson, falling back to json.
+
+    orjson rejects integers wider than 64 bits, which JSONB numbers may be
+    (loads_json keeps them), so such values are encoded with json instead.
+    Datetimes are written in isoformat() form, which orjson matches for
+    every offset in whole minutes.
+
+    Args:
+        value: Value to encode
+        option: orjson option flags
+
+    Returns:
+        The encoded JSON
+    """
+    try:
+        return orjson.dumps(value, option=option)
+    except TypeError:
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), default=_json_default
+        ).encode("utf-8")
@@ -1,7 +1,17 @@
 """Storage layer for entities, edges, and sources."""
 
-from fkg.storage.edges import EdgeStorage
-from fkg.storage.entities import EntityStorage
-from fkg.storage.sources import SourceStorage
+from fkg.storage.edges import AsyncEdgeStorage, EdgeStorage, async_edge_storage
+from fkg.storage.entities import AsyncEntityStorage, EntityStorage, async_entity_storage
+from fkg.storage.sources import AsyncSourceStorage, SourceStorage, async_source_storage
 
-__all__ = ["EntityStorage", "EdgeStorage", "SourceStorage"]
+__all__ = [
+    "EntityStorage",
+    "EdgeStorage",
+    "SourceStorage",
+    "AsyncEntityStorage",
+    "AsyncEdgeStorage",
+    "AsyncSourceStorage",
+    "async_entity_storage",
+    "async_edge_storage",
+    "async_source_storage",
+]
@@ -1,17 +1,120 @@
 """Storage operations for edges."""
 
+from __future__ import annotations
+
+import builtins
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from operator import itemgetter
 from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import ColumnElement, Select, delete, literal_column, select, func, tuple_
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from fkg.changelog.append import append_event
+from fkg.bulk import copy_upsert, supports_copy
+from fkg.changelog.append import append_event, append_events
 from fkg.ids.make_id import make_edge_id
 from fkg.models.edge import Edge
 from fkg.settings import get_settings
 from fkg.validate import validate_edge
 
 
+# True for rows inserted (not updated) by INSERT ... ON CONFLICT DO UPDATE
+_INSERTED = literal_column("xmax = 0").label("inserted")
+
+# Payload keys not copied into Edge.data as extra fields
+_RESERVED_KEYS = frozenset(
+    {"id", "type", "src_id", "dst_id", "schema_version", "authority_id", "properties"}
+)
+
+# Columns written by upsert_many()
+_COLUMNS = ("id", "type", "src_id", "dst_id", "schema_version", "authority_id", "data")
+
+
+def _upsert_statement(target) -> Insert:
+    """INSERT ... ON CONFLICT (id) DO UPDATE of the payload columns.
+
+    Args:
+        target: The Edge model (ORM statement) or its table (Core statement)
+    """
+    stmt = pg_insert(target)
+    return stmt.on_conflict_do_update(
+        index_elements=[Edge.id],
+        set_={
+            "data": stmt.excluded.data,
+            "schema_version": stmt.excluded.schema_version,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _event_payload(values: dict[str, Any]) -> dict[str, Any]:
+    """Changelog payload for an edge create/update."""
+    return {
+        "edge_id": values["id"],
+        "type": values["type"],
+        "src_id": values["src_id"],
+        "dst_id": values["dst_id"],
+    }
+
+
+def _filters(
+    edge_type: str | None,
+    src_id: str | None,
+    dst_id: str | None,
+    authority_id: str | None,
+) -> builtins.list[ColumnElement[bool]]:
+    """Build the WHERE clauses shared by list() and count()."""
+    filters: builtins.list[ColumnElement[bool]] = []
+
+    if edge_type:
+        filters.append(Edge.type == edge_type)
+
+    if src_id:
+        filters.append(Edge.src_id == src_id)
+
+    if dst_id:
+        filters.append(Edge.dst_id == dst_id)
+
+    if authority_id:
+        filters.append(Edge.authority_id == authority_id)
+
+    return filters
+
+
+def _list_statement(
+    edge_type: str | None,
+    src_id: str | None,
+    dst_id: str | None,
+    authority_id: str | None,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, str] | None = None,
+) -> Select:
+    """Build the SELECT used by list()."""
+    stmt = select(Edge).where(*_filters(edge_type, src_id, dst_id, authority_id))
+
+    if after is not None:
+        # Keyset pagination: continue strictly after the last row seen
+        stmt = stmt.where(tuple_(Edge.created_at, Edge.id) < after)
+
+    stmt = stmt.order_by(Edge.created_at.desc(), Edge.id.desc())
+    return stmt.limit(limit).offset(offset)
+
+
+def _count_statement(
+    edge_type: str | None,
+    authority_id: str | None,
+    src_id: str | None = None,
+    dst_id: str | None = None,
+) -> Select:
+    """Build the SELECT used by count(), with the same filters as list()."""
+    filters = _filters(edge_type, src_id, dst_id, authority_id)
+    return select(func.count()).select_from(Edge).where(*filters)
+
+
 class EdgeStorage:
     """Storage operations for edges."""
 
@@ -52,68 +155,38 @@ class EdgeStorage:
         Returns:
             List of matching edges
         """
-        stmt = select(Edge)
-
-        if edge_type:
-            stmt = stmt.where(Edge.type == edge_type)
-
-        if src_id:
-            stmt = stmt.where(Edge.src_id == src_id)
-
-        if dst_id:
-            stmt = stmt.where(Edge.dst_id == dst_id)
-
-        if authority_id:
-            stmt = stmt.where(Edge.authority_id == authority_id)
-
-        stmt = stmt.order_by(Edge.created_at.desc()).limit(limit).offset(offset)
-
+        stmt = _list_statement(edge_type, src_id, dst_id, authority_id, limit, offset)
         return list(self.session.execute(stmt).scalars().all())
 
     def count(
         self,
         edge_type: str | None = None,
         authority_id: str | None = None,
+        src_id: str | None = None,
+        dst_id: str | None = None,
     ) -> int:
         """Count edges with optional filtering.
 
         Args:
             edge_type: Filter by edge type
             authority_id: Filter by authority
+            src_id: Filter by source entity
+            dst_id: Filter by destination entity
 
         Returns:
             Count of matching edges
         """
-        stmt = select(func.count()).select_from(Edge)
-
-        if edge_type:
-            stmt = stmt.where(Edge.type == edge_type)
-
-        if authority_id:
-            stmt = stmt.where(Edge.authority_id == authority_id)
-
+        stmt = _count_statement(edge_type, authority_id, src_id, dst_id)
         return self.session.execute(stmt).scalar() or 0
 
-    def upsert(
+    def _prepare(
         self,
         data: dict[str, Any],
-        authority_id: str | None = None,
-        schema_version: str = "v0.1",
-        validate: bool = True,
-        log_event: bool = True,
-    ) -> Edge:
-        """Insert or update an edge.
-
-        Args:
-            data: Edge data (must include type, src_id, dst_id)
-            authority_id: Authority ID (uses settings if not provided)
-            schema_version: Schema version
-            validate: Whether to validate against schema
-            log_event: Whether to log a changelog event
-
-        Returns:
-            The created/updated edge
-        """
+        authority_id: str | None,
+        schema_version: str,
+        validate: bool,
+    ) -> dict[str, Any]:
+        """Validate an edge payload and build its column values."""
         # Validate required fields
         edge_type = data.get("type")
         src_id = data.get("src_id")
@@ -138,55 +211,136 @@ class EdgeStorage:
         if edge_id is None:
             edge_id = make_edge_id(authority_id, edge_type, src_id, dst_id, properties)
 
-        # Check for existing edge
-        existing = self.get(edge_id)
-
-        # Prepare edge data
+        # Prepare edge data, including any extra fields
         edge_data = {
             "properties": properties,
+            **{k: v for k, v in data.items() if k not in _RESERVED_KEYS},
+        }
+
+        return {
+            "id": edge_id,
+            "type": edge_type,
+            "src_id": src_id,
+            "dst_id": dst_id,
+            "schema_version": schema_version,
+            "authority_id": authority_id,
+            "data": edge_data,
         }
-        # Include any extra fields
-        for k, v in data.items():
-            if k not in ("id", "type", "src_id", "dst_id", "schema_version", "authority_id", "properties"):
-                edge_data[k] = v
-
-        if existing:
-            # Update existing edge
-            existing.data = edge_data
-            existing.schema_version = schema_version
-            edge = existing
-            event_type = "update_edge"
-        else:
-            # Create new edge
-            edge = Edge(
-                id=edge_id,
-                type=edge_type,
-                src_id=src_id,
-                dst_id=dst_id,
-                schema_version=schema_version,
-                authority_id=authority_id,
-                data=edge_data,
-            )
-            self.session.add(edge)
-            event_type = "create_edge"
+
+    def upsert(
+        self,
+        data: dict[str, Any],
+        authority_id: str | None = None,
+        schema_version: str = "v0.1",
+        validate: bool = True,
+        log_event: bool = True,
+    ) -> Edge:
+        """Insert or update an edge.
+
+        Args:
+            data: Edge data (must include type, src_id, dst_id)
+            authority_id: Authority ID (uses settings if not provided)
+            schema_version: Schema version
+            validate: Whether to validate against schema
+            log_event: Whether to log a changelog event
+
+        Returns:
+            The created/updated edge
+        """
+        values = self._prepare(data, authority_id, schema_version, validate)
+
+        # One round trip; populate_existing refreshes an instance already
+        # loaded in the session
+        stmt = _upsert_statement(Edge).values(**values).returning(Edge, _INSERTED)
+        edge, inserted = self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
         # Log event
         if log_event:
             append_event(
                 self.session,
-                event_type=event_type,
-                authority_id=authority_id,
-                payload={
-                    "edge_id": edge_id,
-                    "type": edge_type,
-                    "src_id": src_id,
-                    "dst_id": dst_id,
-                },
+                event_type="create_edge" if inserted else "update_edge",
+                authority_id=values["authority_id"],
+                payload=_event_payload(values),
             )
 
-        self.session.flush()
         return edge
 
+    def upsert_many(
+        self,
+        rows: Iterable[dict[str, Any]],
+        authority_id: str | None = None,
+        schema_version: str = "v0.1",
+        validate: bool = True,
+        log_event: bool = True,
+        on_error: Callable[[dict[str, Any], Exception], None] | None = None,
+        copy: bool = False,
+    ) -> int:
+        """Insert or update many edges with a single INSERT ... ON CONFLICT.
+
+        See EntityStorage.upsert_many; rows are prepared as in upsert().
+
+        Args:
+            rows: Edge payloads (each must include type, src_id, dst_id)
+            authority_id: Authority ID (uses settings if not provided)
+            schema_version: Schema version
+            validate: Whether to validate against schema
+            log_event: Whether to log changelog events
+            on_error: Called with (row, exception) for rows that fail
+                validation or ID generation, which are then skipped. If not
+                provided, the first such error is raised.
+            copy: Whether to load rows and events with COPY through a
+                temporary table, which is faster for large batches. Ignored
+                (rows are upserted with INSERT) unless the driver is psycopg
+
+        Returns:
+            Number of rows written
+        """
+        prepared = []
+        for data in rows:
+            try:
+                prepared.append(self._prepare(data, authority_id, schema_version, validate))
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(data, e)
+
+        if not prepared:
+            return 0
+
+        # A single statement may not touch the same row twice. Sorting by ID
+        # makes concurrent batches lock shared rows in the same order.
+        unique = {values["id"]: values for values in prepared}
+        params = sorted(unique.values(), key=itemgetter("id"))
+
+        copy = copy and supports_copy(self.session)
+        if copy:
+            created = copy_upsert(
+                self.session, Edge.__table__, _COLUMNS, ("data", "schema_version"), params
+            )
+        else:
+            stmt = _upsert_statement(Edge.__table__).returning(Edge.id, _INSERTED)
+            result = self.session.execute(stmt, params)
+            created = {row.id for row in result if row.inserted}
+
+        if log_event:
+            events = []
+            for values in prepared:
+                if values["id"] in created:
+                    created.discard(values["id"])
+                    event_type = "create_edge"
+                else:
+                    event_type = "update_edge"
+                events.append({
+                    "event_type": event_type,
+                    "authority_id": values["authority_id"],
+                    "payload": _event_payload(values),
+                })
+            append_events(self.session, events, copy=copy)
+
+        return len(prepared)
+
     def delete(self, edge_id: str, log_event: bool = True) -> bool:
         """Delete an edge.
 
@@ -197,21 +351,21 @@ class EdgeStorage:
         Returns:
             True if edge was deleted, False if not found
         """
-        edge = self.get(edge_id)
-        if edge is None:
+        stmt = (
+            delete(Edge)
+            .where(Edge.id == edge_id)
+            .returning(Edge.authority_id, Edge.type)
+        )
+        row = self.session.execute(stmt).first()
+        if row is None:
             return False
 
-        authority_id = edge.authority_id
-        edge_type = edge.type
-
-        self.session.delete(edge)
-
         if log_event:
             append_event(
                 self.session,
                 event_type="delete_edge",
-                authority_id=authority_id,
-                payload={"edge_id": edge_id, "type": edge_type},
+                authority_id=row.authority_id,
+                payload={"edge_id": edge_id, "type": row.type},
             )
 
         self.session.flush()
@@ -222,7 +376,7 @@ class EdgeStorage:
         src_id: str,
         dst_id: str,
         edge_type: str | None = None,
-    ) -> list[Edge]:
+    ) -> builtins.list[Edge]:
         """Get edges between two entities.
 
         Args:
@@ -239,3 +393,72 @@ class EdgeStorage:
             stmt = stmt.where(Edge.type == edge_type)
 
         return list(self.session.execute(stmt).scalars().all())
+
+
+class AsyncEdgeStorage:
+    """Read-only edge queries for async sessions.
+
+    Used by the API so that request handlers never block the event loop.
+    Instances hold no state; pass the request's session to each call
+    (the API uses the module-level ``async_edge_storage``).
+    Writes go through EdgeStorage.
+    """
+
+    async def get(self, session: AsyncSession, edge_id: str) -> Edge | None:
+        """Get an edge by ID."""
+        return await session.get(Edge, edge_id)
+
+    async def list(
+        self,
+        session: AsyncSession,
+        edge_type: str | None = None,
+        src_id: str | None = None,
+        dst_id: str | None = None,
+        authority_id: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[Edge]:
+        """List edges with optional filtering (see EdgeStorage.list).
+
+        Pass ``after=(created_at, id)`` of the last row seen to page by keyset
+        instead of offset.
+        """
+        stmt = _list_statement(edge_type, src_id, dst_id, authority_id, limit, offset, after)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_rows(
+        self,
+        session: AsyncSession,
+        edge_type: str | None = None,
+        src_id: str | None = None,
+        dst_id: str | None = None,
+        authority_id: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> builtins.list[dict[str, Any]]:
+        """Like list(), but return plain column dicts instead of ORM objects.
+
+        The dicts have the same keys as Edge.to_dict().
+        """
+        stmt = _list_statement(edge_type, src_id, dst_id, authority_id, limit, offset, after)
+        result = await session.execute(stmt.with_only_columns(*Edge.__table__.columns))
+        return [dict(row) for row in result.mappings()]
+
+    async def count(
+        self,
+        session: AsyncSession,
+        edge_type: str | None = None,
+        authority_id: str | None = None,
+        src_id: str | None = None,
+        dst_id: str | None = None,
+    ) -> int:
+        """Count edges with optional filtering (see EdgeStorage.count)."""
+        stmt = _count_statement(edge_type, authority_id, src_id, dst_id)
+        result = await session.execute(stmt)
+        return result.scalar() or 0
+
+
+async_edge_storage = AsyncEdgeStorage()
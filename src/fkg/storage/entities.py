@@ -1,17 +1,142 @@
 """Storage operations for entities."""
 
+from __future__ import annotations
+
+import builtins
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from operator import itemgetter
 from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import ColumnElement, Select, Text, delete, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from fkg.changelog.append import append_event
+from fkg.bulk import copy_upsert, supports_copy
+from fkg.changelog.append import append_event, append_events
 from fkg.ids import make_id
 from fkg.models.entity import Entity
 from fkg.settings import get_settings
 from fkg.validate import validate_entity
 
 
+# RETURNING expression that is true for rows inserted (not updated) by an
+# INSERT ... ON CONFLICT DO UPDATE: only fresh row versions have xmax = 0
+_INSERTED = literal_column("xmax = 0").label("inserted")
+
+# Payload keys stored as columns rather than in Entity.data
+_RESERVED_KEYS = frozenset({"id", "type", "schema_version", "authority_id"})
+
+# Columns written by upsert_many()
+_COLUMNS = ("id", "type", "schema_version", "authority_id", "data")
+
+
+def _upsert_statement(target) -> Insert:
+    """INSERT ... ON CONFLICT (id) DO UPDATE of the payload columns.
+
+    Args:
+        target: The Entity model (ORM statement) or its table (Core statement)
+    """
+    stmt = pg_insert(target)
+    return stmt.on_conflict_do_update(
+        index_elements=[Entity.id],
+        set_={
+            "data": stmt.excluded.data,
+            "schema_version": stmt.excluded.schema_version,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def _name_text() -> ColumnElement[str]:
+    """``data ->> 'name'`` with the key inlined so it matches the trigram index."""
+    return Entity.data.op("->>", return_type=Text)(literal_column("'name'"))
+
+
+def _filters(
+    entity_type: str | None,
+    authority_id: str | None,
+    query: str | None,
+    name: str | None,
+) -> builtins.list[ColumnElement[bool]]:
+    """Build the WHERE clauses shared by list() and count()."""
+    filters: builtins.list[ColumnElement[bool]] = []
+
+    if entity_type:
+        filters.append(Entity.type == entity_type)
+
+    if authority_id:
+        filters.append(Entity.authority_id == authority_id)
+
+    if name:
+        # Exact match via containment (@>), served by the jsonb_path_ops GIN index
+        filters.append(Entity.data.contains({"name": name}))
+
+    if query:
+        # Substring search on data->>'name', served by the trigram GIN index
+        filters.append(_name_text().ilike(f"%{query}%"))
+
+    return filters
+
+
+def _list_statement(
+    entity_type: str | None,
+    authority_id: str | None,
+    query: str | None,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, str] | None = None,
+    name: str | None = None,
+) -> Select:
+    """Build the SELECT used by list()."""
+    stmt = select(Entity).where(*_filters(entity_type, authority_id, query, name))
+
+    if after is not None:
+        # Keyset pagination: continue strictly after the last row seen
+        stmt = stmt.where(tuple_(Entity.created_at, Entity.id) < after)
+
+    stmt = stmt.order_by(Entity.created_at.desc(), Entity.id.desc())
+    return stmt.limit(limit).offset(offset)
+
+
+def _count_statement(
+    entity_type: str | None,
+    authority_id: str | None,
+    query: str | None = None,
+    name: str | None = None,
+) -> Select:
+    """Build the SELECT used by count(), with the same filters as list()."""
+    filters = _filters(entity_type, authority_id, query, name)
+    return select(func.count()).select_from(Entity).where(*filters)
+
+
+def _neighbors_statement(
+    entity_id: str,
+    edge_type: str | None,
+    direction: str,
+    limit: int,
+) -> Select:
+    """Build the single SELECT used by get_neighbors().
+
+    Neighbor IDs come from a semi-join on edges, so the entities are fetched
+    in the same round trip and each neighbor appears once.
+    """
+    from fkg.models.edge import Edge
+
+    if direction == "out":
+        # Get entities at the destination of edges from this entity
+        stmt = select(Edge.dst_id).where(Edge.src_id == entity_id)
+    else:  # direction == "in"
+        # Get entities at the source of edges to this entity
+        stmt = select(Edge.src_id).where(Edge.dst_id == entity_id)
+
+    if edge_type:
+        stmt = stmt.where(Edge.type == edge_type)
+
+    return select(Entity).where(Entity.id.in_(stmt.limit(limit)))
+
+
 class EntityStorage:
     """Storage operations for entities."""
 
@@ -37,58 +162,82 @@ class EntityStorage:
         query: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        name: str | None = None,
     ) -> list[Entity]:
         """List entities with optional filtering.
 
         Args:
             entity_type: Filter by entity type
             authority_id: Filter by authority
-            query: Search query (matches name field)
+            query: Search query (substring match on name field)
             limit: Maximum results to return
             offset: Offset for pagination
+            name: Exact name to match
 
         Returns:
             List of matching entities
         """
-        stmt = select(Entity)
-
-        if entity_type:
-            stmt = stmt.where(Entity.type == entity_type)
-
-        if authority_id:
-            stmt = stmt.where(Entity.authority_id == authority_id)
-
-        if query:
-            # Search in the name field of the JSONB data
-            stmt = stmt.where(Entity.data["name"].astext.ilike(f"%{query}%"))
-
-        stmt = stmt.order_by(Entity.created_at.desc()).limit(limit).offset(offset)
-
+        stmt = _list_statement(entity_type, authority_id, query, limit, offset, name=name)
         return list(self.session.execute(stmt).scalars().all())
 
     def count(
         self,
         entity_type: str | None = None,
         authority_id: str | None = None,
+        query: str | None = None,
+        name: str | None = None,
     ) -> int:
         """Count entities with optional filtering.
 
         Args:
             entity_type: Filter by entity type
             authority_id: Filter by authority
+            query: Search query (substring match on name field)
+            name: Exact name to match
 
         Returns:
             Count of matching entities
         """
-        stmt = select(func.count()).select_from(Entity)
+        stmt = _count_statement(entity_type, authority_id, query, name)
+        return self.session.execute(stmt).scalar() or 0
+
+    def _prepare(
+        self,
+        data: dict[str, Any],
+        entity_type: str | None,
+        authority_id: str | None,
+        schema_version: str,
+        validate: bool,
+    ) -> dict[str, Any]:
+        """Validate an entity payload and build its column values."""
+        # Determine entity type
+        if entity_type is None:
+            entity_type = data.get("type")
+            if entity_type is None:
+                raise ValueError("Entity type must be specified")
 
-        if entity_type:
-            stmt = stmt.where(Entity.type == entity_type)
+        # Determine authority
+        if authority_id is None:
+            settings = get_settings()
+            authority_id = settings.instance.id
 
-        if authority_id:
-            stmt = stmt.where(Entity.authority_id == authority_id)
+        # Validate if requested
+        if validate:
+            validate_entity(data, entity_type, schema_version)
 
-        return self.session.execute(stmt).scalar() or 0
+        # Generate ID if not provided
+        entity_id = data.get("id")
+        if entity_id is None:
+            entity_id = make_id(authority_id, entity_type, data)
+
+        return {
+            "id": entity_id,
+            "type": entity_type,
+            "schema_version": schema_version,
+            "authority_id": authority_id,
+            # Separate metadata from payload
+            "data": {k: v for k, v in data.items() if k not in _RESERVED_KEYS},
+        }
 
     def upsert(
         self,
@@ -112,62 +261,109 @@ class EntityStorage:
         Returns:
             The created/updated entity
         """
-        # Determine entity type
-        if entity_type is None:
-            entity_type = data.get("type")
-            if entity_type is None:
-                raise ValueError("Entity type must be specified")
-
-        # Determine authority
-        if authority_id is None:
-            settings = get_settings()
-            authority_id = settings.instance.id
-
-        # Validate if requested
-        if validate:
-            validate_entity(data, entity_type, schema_version)
+        values = self._prepare(data, entity_type, authority_id, schema_version, validate)
 
-        # Generate ID if not provided
-        entity_id = data.get("id")
-        if entity_id is None:
-            entity_id = make_id(authority_id, entity_type, data)
-
-        # Check for existing entity
-        existing = self.get(entity_id)
-
-        # Prepare entity data (separate metadata from payload)
-        entity_data = {k: v for k, v in data.items() if k not in ("id", "type", "schema_version", "authority_id")}
-
-        if existing:
-            # Update existing entity
-            existing.data = entity_data
-            existing.schema_version = schema_version
-            entity = existing
-            event_type = "update_entity"
-        else:
-            # Create new entity
-            entity = Entity(
-                id=entity_id,
-                type=entity_type,
-                schema_version=schema_version,
-                authority_id=authority_id,
-                data=entity_data,
-            )
-            self.session.add(entity)
-            event_type = "create_entity"
+        # One round trip; populate_existing refreshes an instance already
+        # loaded in the session
+        stmt = _upsert_statement(Entity).values(**values).returning(Entity, _INSERTED)
+        entity, inserted = self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
 
         # Log event
         if log_event:
             append_event(
                 self.session,
-                event_type=event_type,
-                authority_id=authority_id,
-                payload={"entity_id": entity_id, "type": entity_type},
+                event_type="create_entity" if inserted else "update_entity",
+                authority_id=values["authority_id"],
+                payload={"entity_id": values["id"], "type": values["type"]},
             )
 
-        self.session.flush()
         return entity
 
+    def upsert_many(
+        self,
+        rows: Iterable[dict[str, Any]],
+        entity_type: str | None = None,
+        authority_id: str | None = None,
+        schema_version: str = "v0.1",
+        validate: bool = True,
+        log_event: bool = True,
+        on_error: Callable[[dict[str, Any], Exception], None] | None = None,
+        copy: bool = False,
+    ) -> int:
+        """Insert or update many entities with a single INSERT ... ON CONFLICT.
+
+        Rows are prepared exactly as in upsert(), then written in one
+        multi-row statement instead of a SELECT and INSERT/UPDATE per row.
+        If the same ID appears more than once, the last row wins and the
+        changelog records a create followed by updates, as sequential
+        upserts would. Entities already loaded in the session are not
+        refreshed.
+
+        Args:
+            rows: Entity payloads
+            entity_type: Entity type (uses each row's 'type' if not provided)
+            authority_id: Authority ID (uses settings if not provided)
+            schema_version: Schema version
+            validate: Whether to validate against schema
+            log_event: Whether to log changelog events
+            on_error: Called with (row, exception) for rows that fail
+                validation or ID generation, which are then skipped. If not
+                provided, the first such error is raised.
+            copy: Whether to load rows and events with COPY through a
+                temporary table, which is faster for large batches. Ignored
+                (rows are upserted with INSERT) unless the driver is psycopg
+
+        Returns:
+            Number of rows written
+        """
+        prepared = []
+        for data in rows:
+            try:
+                prepared.append(
+                    self._prepare(data, entity_type, authority_id, schema_version, validate)
+                )
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(data, e)
+
+        if not prepared:
+            return 0
+
+        # A single statement may not touch the same row twice. Sorting by ID
+        # makes concurrent batches lock shared rows in the same order.
+        unique = {values["id"]: values for values in prepared}
+        params = sorted(unique.values(), key=itemgetter("id"))
+
+        copy = copy and supports_copy(self.session)
+        if copy:
+            created = copy_upsert(
+                self.session, Entity.__table__, _COLUMNS, ("data", "schema_version"), params
+            )
+        else:
+            stmt = _upsert_statement(Entity.__table__).returning(Entity.id, _INSERTED)
+            result = self.session.execute(stmt, params)
+            created = {row.id for row in result if row.inserted}
+
+        if log_event:
+            events = []
+            for values in prepared:
+                if values["id"] in created:
+                    created.discard(values["id"])
+                    event_type = "create_entity"
+                else:
+                    event_type = "update_entity"
+                events.append({
+                    "event_type": event_type,
+                    "authority_id": values["authority_id"],
+                    "payload": {"entity_id": values["id"], "type": values["type"]},
+                })
+            append_events(self.session, events, copy=copy)
+
+        return len(prepared)
+
     def delete(self, entity_id: str, log_event: bool = True) -> bool:
         """Delete an entity.
 
@@ -178,21 +374,21 @@ class EntityStorage:
         Returns:
             True if entity was deleted, False if not found
         """
-        entity = self.get(entity_id)
-        if entity is None:
+        stmt = (
+            delete(Entity)
+            .where(Entity.id == entity_id)
+            .returning(Entity.authority_id, Entity.type)
+        )
+        row = self.session.execute(stmt).first()
+        if row is None:
             return False
 
-        authority_id = entity.authority_id
-        entity_type = entity.type
-
-        self.session.delete(entity)
-
         if log_event:
             append_event(
                 self.session,
                 event_type="delete_entity",
-                authority_id=authority_id,
-                payload={"entity_id": entity_id, "type": entity_type},
+                authority_id=row.authority_id,
+                payload={"entity_id": entity_id, "type": row.type},
             )
 
         self.session.flush()
@@ -204,7 +400,7 @@ class EntityStorage:
         edge_type: str | None = None,
         direction: str = "out",
         limit: int = 100,
-    ) -> list[Entity]:
+    ) -> builtins.list[Entity]:
         """Get neighboring entities connected by edges.
 
         Args:
@@ -215,29 +411,89 @@ class EntityStorage:
         Returns:
             List of connected entities
         """
-        from fkg.models.edge import Edge
+        stmt = _neighbors_statement(entity_id, edge_type, direction, limit)
+        return list(self.session.execute(stmt).scalars().all())
 
-        if direction == "out":
-            # Get entities at the destination of edges from this entity
-            edge_stmt = select(Edge.dst_id).where(Edge.src_id == entity_id)
-            if edge_type:
-                edge_stmt = edge_stmt.where(Edge.type == edge_type)
-            edge_stmt = edge_stmt.limit(limit)
 
-            neighbor_ids = [row[0] for row in self.session.execute(edge_stmt).all()]
+class AsyncEntityStorage:
+    """Read-only entity queries for async sessions.
 
-        else:  # direction == "in"
-            # Get entities at the source of edges to this entity
-            edge_stmt = select(Edge.src_id).where(Edge.dst_id == entity_id)
-            if edge_type:
-                edge_stmt = edge_stmt.where(Edge.type == edge_type)
-            edge_stmt = edge_stmt.limit(limit)
+    Used by the API so that request handlers never block the event loop.
+    Instances hold no state; pass the request's session to each call
+    (the API uses the module-level ``async_entity_storage``).
+    Writes go through EntityStorage.
+    """
 
-            neighbor_ids = [row[0] for row in self.session.execute(edge_stmt).all()]
+    async def get(self, session: AsyncSession, entity_id: str) -> Entity | None:
+        """Get an entity by ID."""
+        return await session.get(Entity, entity_id)
 
-        if not neighbor_ids:
-            return []
+    async def list(
+        self,
+        session: AsyncSession,
+        entity_type: str | None = None,
+        authority_id: str | None = None,
+        query: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+        name: str | None = None,
+    ) -> list[Entity]:
+        """List entities with optional filtering (see EntityStorage.list).
 
-        # Fetch the entities
-        stmt = select(Entity).where(Entity.id.in_(neighbor_ids))
-        return list(self.session.execute(stmt).scalars().all())
+        Pass ``after=(created_at, id)`` of the last row seen to page by keyset
+        instead of offset.
+        """
+        stmt = _list_statement(entity_type, authority_id, query, limit, offset, after, name)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_rows(
+        self,
+        session: AsyncSession,
+        entity_type: str | None = None,
+        authority_id: str | None = None,
+        query: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+        name: str | None = None,
+    ) -> builtins.list[dict[str, Any]]:
+        """Like list(), but return plain column dicts instead of ORM objects.
+
+        The dicts have the same keys as Entity.to_dict(). Skipping ORM
+        hydration and the identity map makes this the cheaper choice for
+        read-only responses.
+        """
+        stmt = _list_statement(entity_type, authority_id, query, limit, offset, after, name)
+        result = await session.execute(stmt.with_only_columns(*Entity.__table__.columns))
+        return [dict(row) for row in result.mappings()]
+
+    async def count(
+        self,
+        session: AsyncSession,
+        entity_type: str | None = None,
+        authority_id: str | None = None,
+        query: str | None = None,
+        name: str | None = None,
+    ) -> int:
+        """Count entities with optional filtering (see EntityStorage.count)."""
+        stmt = _count_statement(entity_type, authority_id, query, name)
+        result = await session.execute(stmt)
+        return result.scalar() or 0
+
+    async def get_neighbors(
+        self,
+        session: AsyncSession,
+        entity_id: str,
+        edge_type: str | None = None,
+        direction: str = "out",
+        limit: int = 100,
+    ) -> builtins.list[Entity]:
+        """Get neighboring entities connected by edges (see EntityStorage.get_neighbors)."""
+        stmt = _neighbors_statement(entity_id, edge_type, direction, limit)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+
+async_entity_storage = AsyncEntityStorage()
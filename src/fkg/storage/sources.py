@@ -1,16 +1,62 @@
 """Storage operations for sources and evidence."""
 
+from __future__ import annotations
+
+from datetime import datetime
 from typing import Any
-from uuid import uuid4
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, select, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fkg.ids.make_id import make_id
+from fkg.ids.uuid7 import uuid7
 from fkg.models.evidence import Evidence
 from fkg.models.source import Source
 
 
+def _build_provenance(
+    entity_id: str, evidence_sources: list[tuple[Evidence, Source | None]]
+) -> dict[str, Any]:
+    """Assemble the provenance response from (evidence, source) pairs."""
+    sources = []
+    for ev, source in evidence_sources:
+        sources.append({
+            "evidence_id": str(ev.id),
+            "source_id": ev.source_id,
+            "source": source.to_dict() if source else None,
+            "confidence": ev.confidence,
+            "extracted_at": ev.extracted_at,
+            "notes": ev.notes,
+        })
+
+    # Calculate aggregate confidence
+    if sources:
+        avg_confidence = sum(s["confidence"] for s in sources) / len(sources)
+    else:
+        avg_confidence = None
+
+    return {
+        "entity_id": entity_id,
+        "source_count": len(sources),
+        "average_confidence": avg_confidence,
+        "sources": sources,
+    }
+
+
+def _provenance_statement(entity_id: str) -> Select:
+    """Build the SELECT of (evidence, source) pairs used for provenance.
+
+    An outer join, so evidence whose source is missing still appears.
+    """
+    return (
+        select(Evidence, Source)
+        .outerjoin(Source, Source.id == Evidence.source_id)
+        .where(Evidence.entity_id == entity_id)
+    )
+
+
 class SourceStorage:
     """Storage operations for sources and evidence."""
 
@@ -29,18 +75,29 @@ class SourceStorage:
         """
         return self.session.get(Source, source_id)
 
-    def list_sources(self, limit: int = 100, offset: int = 0) -> list[Source]:
-        """List all sources.
+    def list_sources(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[Source]:
+        """List all sources, newest first.
 
         Args:
             limit: Maximum results to return
             offset: Offset for pagination
+            after: (created_at, id) of the last row seen, to page by keyset
+                instead of offset
 
         Returns:
             List of sources
         """
-        stmt = select(Source).order_by(Source.created_at.desc()).limit(limit).offset(offset)
-        return list(self.session.execute(stmt).scalars().all())
+        stmt = select(Source)
+        if after is not None:
+            # Keyset pagination: continue strictly after the last row seen
+            stmt = stmt.where(tuple_(Source.created_at, Source.id) < after)
+        stmt = stmt.order_by(Source.created_at.desc(), Source.id.desc())
+        return list(self.session.execute(stmt.limit(limit).offset(offset)).scalars().all())
 
     def count_sources(self) -> int:
         """Count all sources.
@@ -68,21 +125,18 @@ class SourceStorage:
             # Generate from source data
             source_id = make_id("source", data.get("type", "unknown"), data)
 
-        # Check for existing source
-        existing = self.get_source(source_id)
-
         # Prepare source data
         source_data = {k: v for k, v in data.items() if k != "id"}
 
-        if existing:
-            existing.data = source_data
-            source = existing
-        else:
-            source = Source(id=source_id, data=source_data)
-            self.session.add(source)
-
-        self.session.flush()
-        return source
+        # One round trip; populate_existing refreshes an instance already
+        # loaded in the session
+        stmt = pg_insert(Source).values(id=source_id, data=source_data)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Source.id], set_={"data": stmt.excluded.data}
+        ).returning(Source)
+        return self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        ).scalar_one()
 
     def get_evidence(self, evidence_id: str) -> Evidence | None:
         """Get evidence by ID.
@@ -138,7 +192,7 @@ class SourceStorage:
             The created evidence record
         """
         evidence = Evidence(
-            id=str(uuid4()),
+            id=uuid7(),
             entity_id=entity_id,
             source_id=source_id,
             confidence=confidence,
@@ -157,29 +211,42 @@ class SourceStorage:
         Returns:
             Dictionary with sources and evidence
         """
-        evidence_list = self.list_evidence_for_entity(entity_id)
-
-        sources = []
-        for ev in evidence_list:
-            source = self.get_source(ev.source_id)
-            sources.append({
-                "evidence_id": str(ev.id),
-                "source_id": ev.source_id,
-                "source": source.to_dict() if source else None,
-                "confidence": ev.confidence,
-                "extracted_at": ev.extracted_at.isoformat() if ev.extracted_at else None,
-                "notes": ev.notes,
-            })
-
-        # Calculate aggregate confidence
-        if sources:
-            avg_confidence = sum(s["confidence"] for s in sources) / len(sources)
-        else:
-            avg_confidence = None
-
-        return {
-            "entity_id": entity_id,
-            "source_count": len(sources),
-            "average_confidence": avg_confidence,
-            "sources": sources,
-        }
+        pairs = self.session.execute(_provenance_statement(entity_id)).tuples().all()
+        return _build_provenance(entity_id, pairs)
+
+
+class AsyncSourceStorage:
+    """Read-only source and evidence queries for async sessions.
+
+    Used by the API so that request handlers never block the event loop.
+    Instances hold no state; pass the request's session to each call
+    (the API uses the module-level ``async_source_storage``).
+    Writes go through SourceStorage.
+    """
+
+    async def get_source(self, session: AsyncSession, source_id: str) -> Source | None:
+        """Get a source by ID."""
+        return await session.get(Source, source_id)
+
+    async def count_sources(self, session: AsyncSession) -> int:
+        """Count all sources."""
+        result = await session.execute(select(func.count()).select_from(Source))
+        return result.scalar() or 0
+
+    async def list_evidence_for_entity(
+        self, session: AsyncSession, entity_id: str
+    ) -> list[Evidence]:
+        """List all evidence for an entity."""
+        stmt = select(Evidence).where(Evidence.entity_id == entity_id)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_entity_provenance(
+        self, session: AsyncSession, entity_id: str
+    ) -> dict[str, Any]:
+        """Get full provenance information for an entity (see SourceStorage)."""
+        result = await session.execute(_provenance_statement(entity_id))
+        return _build_provenance(entity_id, result.tuples().all())
+
+
+async_source_storage = AsyncSourceStorage()
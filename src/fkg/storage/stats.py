@@ -0,0 +1,26 @@
+"""Aggregate statistics over the whole graph."""
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fkg.models.edge import Edge
+from fkg.models.entity import Entity
+from fkg.models.source import Source
+
+
+async def get_graph_counts(session: AsyncSession) -> dict[str, int]:
+    """Count entities, edges and sources in a single round trip.
+
+    Args:
+        session: Async database session
+
+    Returns:
+        Dict with ``entities``, ``edges`` and ``sources`` counts
+    """
+    stmt = select(
+        select(func.count()).select_from(Entity).scalar_subquery().label("entities"),
+        select(func.count()).select_from(Edge).scalar_subquery().label("edges"),
+        select(func.count()).select_from(Source).scalar_subquery().label("sources"),
+    )
+    row = (await session.execute(stmt)).one()
+    return dict(row._mapping)
@@ -1,9 +1,9 @@
 """JSON Schema registry for entity and edge validation."""
 
-import json
 from pathlib import Path
 from typing import Any
 
+from fkg.serialization import loads_json
 from fkg.settings import get_schemas_dir
 
 
@@ -40,11 +40,12 @@ class SchemaRegistry:
             return self._cache[cache_key]
 
         schema_path = self._schemas_dir / version / f"{name}.json"
-        if not schema_path.exists():
+        try:
+            data = schema_path.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Schema not found: {schema_path}")
 
-        with open(schema_path) as f:
-            schema = json.load(f)
+        schema = loads_json(data)
 
         self._cache[cache_key] = schema
         return schema
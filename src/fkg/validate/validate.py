@@ -3,10 +3,22 @@
 from typing import Any
 
 import jsonschema
-from jsonschema import Draft7Validator
+from jsonschema import Draft4Validator, Draft6Validator, Draft7Validator, Draft201909Validator
+from jsonschema.validators import validator_for
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 from fkg.validate.registry import get_registry
 
+# Drafts fastjsonschema implements; schemas for later drafts are validated
+# with jsonschema alone
+_COMPILABLE_DRAFTS = frozenset(
+    (Draft4Validator, Draft6Validator, Draft7Validator, Draft201909Validator)
+)
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -16,6 +28,63 @@ class ValidationError(Exception):
         self.errors = errors or []
 
 
+class _SchemaValidator:
+    """Validator for one schema, built once and reused for every record.
+
+    When fastjsonschema is available and implements the schema's draft, the
+    schema is also compiled to Python code, which is used to accept valid
+    records quickly. Records it rejects are checked again with jsonschema,
+    which stays the authority and produces the error messages, using the
+    draft named by the schema's ``$schema`` (draft 7 if it names none).
+    Defaults and formats are left alone, as with the jsonschema validators.
+    """
+
+    def __init__(self, schema: dict[str, Any]):
+        self.schema = schema
+        cls = validator_for(schema, default=Draft7Validator)
+        cls.check_schema(schema)
+        self._validator = cls(schema)
+        self._compiled = None
+        if fastjsonschema is not None and cls in _COMPILABLE_DRAFTS:
+            try:
+                # The draft is named explicitly: without $schema,
+                # fastjsonschema would assume 2019-09 rather than draft 7
+                self._compiled = fastjsonschema.compile(
+                    {**schema, "$schema": cls.META_SCHEMA["$schema"]},
+                    use_default=False,
+                    use_formats=False,
+                )
+            except Exception:
+                # Schemas it cannot compile are validated with jsonschema alone
+                pass
+
+    def errors(self, data: Any) -> list[str]:
+        """Return a message per validation error (empty if ``data`` is valid)."""
+        if self._compiled is not None:
+            try:
+                self._compiled(data)
+                return []
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+
+        error_messages = []
+        for error in self._validator.iter_errors(data):
+            path = ".".join(str(p) for p in error.path) if error.path else "(root)"
+            error_messages.append(f"{path}: {error.message}")
+        return error_messages
+
+
+# Validators by id() of the (registry-cached) schema they were built for
+_validators: dict[int, _SchemaValidator] = {}
+
+
+def _get_validator(schema: dict[str, Any]) -> _SchemaValidator:
+    validator = _validators.get(id(schema))
+    if validator is None or validator.schema is not schema:
+        validator = _validators[id(schema)] = _SchemaValidator(schema)
+    return validator
+
+
 def validate_entity(
     data: dict[str, Any],
     entity_type: str | None = None,
@@ -45,17 +114,11 @@ def validate_entity(
         raise ValidationError(f"Unknown entity type: {entity_type}")
 
     # Validate
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
-
-    if errors:
-        error_messages = []
-        for error in errors:
-            path = ".".join(str(p) for p in error.path) if error.path else "(root)"
-            error_messages.append(f"{path}: {error.message}")
+    error_messages = _get_validator(schema).errors(data)
 
+    if error_messages:
         raise ValidationError(
-            f"Entity validation failed with {len(errors)} error(s)",
+            f"Entity validation failed with {len(error_messages)} error(s)",
             errors=error_messages,
         )
 
@@ -73,17 +136,11 @@ def validate_edge(data: dict[str, Any], version: str = "v0.1") -> None:
     registry = get_registry()
     schema = registry.get_edge_schema(version)
 
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
-
-    if errors:
-        error_messages = []
-        for error in errors:
-            path = ".".join(str(p) for p in error.path) if error.path else "(root)"
-            error_messages.append(f"{path}: {error.message}")
+    error_messages = _get_validator(schema).errors(data)
 
+    if error_messages:
         raise ValidationError(
-            f"Edge validation failed with {len(errors)} error(s)",
+            f"Edge validation failed with {len(error_messages)} error(s)",
             errors=error_messages,
         )
 
@@ -101,17 +158,11 @@ def validate_source(data: dict[str, Any], version: str = "v0.1") -> None:
     registry = get_registry()
     schema = registry.get_source_schema(version)
 
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
-
-    if errors:
-        error_messages = []
-        for error in errors:
-            path = ".".join(str(p) for p in error.path) if error.path else "(root)"
-            error_messages.append(f"{path}: {error.message}")
+    error_messages = _get_validator(schema).errors(data)
 
+    if error_messages:
         raise ValidationError(
-            f"Source validation failed with {len(errors)} error(s)",
+            f"Source validation failed with {len(error_messages)} error(s)",
             errors=error_messages,
         )
 
@@ -129,16 +180,10 @@ def validate_manifest(data: dict[str, Any], version: str = "v0.1") -> None:
     registry = get_registry()
     schema = registry.get_manifest_schema(version)
 
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
-
-    if errors:
-        error_messages = []
-        for error in errors:
-            path = ".".join(str(p) for p in error.path) if error.path else "(root)"
-            error_messages.append(f"{path}: {error.message}")
+    error_messages = _get_validator(schema).errors(data)
 
+    if error_messages:
         raise ValidationError(
-            f"Manifest validation failed with {len(errors)} error(s)",
+            f"Manifest validation failed with {len(error_messages)} error(s)",
             errors=error_messages,
         )
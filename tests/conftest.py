@@ -15,12 +15,22 @@ os.environ.setdefault("FKG_INSTANCE__AUTHORITY_NAME", "Test Instance")
 os.environ.setdefault("FKG_INSTANCE__JURISDICTION", "Test")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schemas_dir():
     """Return path to schemas directory."""
     return Path(__file__).parent.parent / "schemas"
 
 
+@pytest.fixture(scope="session")
+def schema_registry(schemas_dir):
+    """Install one schema registry, shared by every test that validates."""
+    from fkg.validate.registry import SchemaRegistry, set_registry
+
+    registry = SchemaRegistry(schemas_dir)
+    set_registry(registry)
+    return registry
+
+
 @pytest.fixture
 def sample_organization():
     """Return a sample organization entity."""
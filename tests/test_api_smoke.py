@@ -37,6 +37,27 @@ class TestWhoamiEndpoint:
         assert "jurisdiction" in data
         assert "schema_version" in data
 
+    def test_whoami_conditional_request(self, client):
+        """Whoami should return 304 when the client's ETag is current."""
+        response = client.get("/whoami")
+        etag = response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+        response = client.get("/whoami", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+
+class TestORJSONResponse:
+    """Tests for the default response class."""
+
+    def test_renders_wide_ints(self):
+        """JSONB integers wider than 64 bits should render, not fail."""
+        from fkg.api.responses import ORJSONResponse
+
+        response = ORJSONResponse({"data": {"population": 2**64}, "items": []})
+        assert response.body == b'{"data":{"population":18446744073709551616},"items":[]}'
+
 
 class TestEntitiesEndpoint:
     """Tests for /entities endpoints."""
@@ -67,6 +88,11 @@ class TestEntitiesEndpoint:
             assert data["limit"] == 10
             assert data["offset"] == 0
 
+    def test_list_entities_invalid_cursor(self, client):
+        """A malformed cursor is rejected before touching the database."""
+        response = client.get("/entities?cursor=not-a-cursor")
+        assert response.status_code == 400
+
 
 class TestEdgesEndpoint:
     """Tests for /edges endpoints."""
@@ -0,0 +1,122 @@
+"""Tests for splitting CSV files across ingest workers."""
+
+import csv
+
+from fkg.cli.commands import (
+    _csv_segment_is_line_aligned,
+    _csv_segments,
+    _ingest_csv_parallel,
+    _segment_lines,
+)
+
+
+def _rows(path, workers):
+    """Rows as the workers would read them, segment by segment."""
+    fieldnames, segments = _csv_segments(path, workers)
+    rows = []
+    for start, end in segments:
+        rows.extend(csv.DictReader(_segment_lines(path, start, end), fieldnames=fieldnames))
+    return rows
+
+
+def _serial_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _aligned(path, workers):
+    _, segments = _csv_segments(path, workers)
+    return all(_csv_segment_is_line_aligned(path, start, end) for start, end in segments)
+
+
+class TestCsvSegments:
+    """Tests for _csv_segments and _csv_segment_is_line_aligned."""
+
+    def test_segments_cover_every_row(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        path.write_text("name,city\n" + "".join(f"Org {i},City {i}\n" for i in range(200)))
+
+        for workers in (1, 3, 7, 50):
+            fieldnames, segments = _csv_segments(path, workers)
+            assert fieldnames == ["name", "city"]
+            assert segments[0][0] == len("name,city\n")
+            assert segments[-1][1] == path.stat().st_size
+            assert all(end == start for (_, end), (start, _) in zip(segments, segments[1:]))
+            assert _aligned(path, workers)
+            assert _rows(path, workers) == _serial_rows(path)
+
+    def test_quoted_newline_is_detected_anywhere(self, tmp_path):
+        lines = [f"Org {i},City {i}\n" for i in range(100)]
+        # A long first line makes some cuts fall inside the record
+        record = '"Multi' + "x" * 300 + '\nline Org",Somewhere\n'
+        start_offset = len("name,city\n")
+
+        for position in (0, 50, 99):
+            path = tmp_path / f"orgs_{position}.csv"
+            body = lines[:position] + [record] + lines[position:]
+            path.write_text("name,city\n" + "".join(body))
+            record_start = start_offset + sum(len(line) for line in lines[:position])
+            record_end = record_start + len(record)
+
+            straddled = False
+            for workers in range(1, 80):
+                _, segments = _csv_segments(path, workers)
+                # Some worker counts put a cut inside the quoted record
+                straddled |= any(record_start < end < record_end for _, end in segments)
+                assert not _aligned(path, workers), (position, workers)
+            assert straddled
+
+    def test_crlf_line_endings(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        rows = b"".join(b"Org %d,City %d\r\n" % (i, i) for i in range(100))
+        path.write_bytes(b"name,city\r\n" + rows)
+
+        for workers in (1, 4, 30):
+            assert _aligned(path, workers)
+            assert _rows(path, workers) == _serial_rows(path)
+
+        path.write_bytes(path.read_bytes() + b'"Multi\r\nline Org",Somewhere\r\n')
+        assert not _aligned(path, 30)
+
+    def test_blank_lines(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        path.write_text("name,city\n" + "".join(f"Org {i},City {i}\n\n" for i in range(50)) + "\n")
+
+        for workers in (1, 4, 30):
+            assert _aligned(path, workers)
+            assert _rows(path, workers) == _serial_rows(path)
+
+    def test_header_only(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        path.write_text("name,city\n")
+
+        assert _csv_segments(path, 4) == (["name", "city"], [])
+
+    def test_quoted_newline_in_header(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        path.write_text('name,"home\ncity"\n' + "".join(f"Org {i},City {i}\n" for i in range(20)))
+
+        fieldnames, segments = _csv_segments(path, 4)
+        assert fieldnames == ["name", "home\ncity"]
+        assert segments[0][0] == len('name,"home\ncity"\n')
+        assert _aligned(path, 4)
+        assert _rows(path, 4) == _serial_rows(path)
+
+
+class TestIngestCsvParallel:
+    """Tests for the parallel ingest fallback."""
+
+    def test_multiline_records_fall_back_to_one_process(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        lines = [f"Org {i},City {i}\n" for i in range(100)]
+        body = lines[:50] + ['"Multi\nline Org",X\n'] + lines[50:]
+        path.write_text("name,city\n" + "".join(body))
+
+        # Nothing is written (so no database is needed) before the check fails
+        assert _ingest_csv_parallel(path, "organization", "name", False, 100, 2) is None
+
+    def test_header_only_file_writes_nothing(self, tmp_path):
+        path = tmp_path / "orgs.csv"
+        path.write_text("name,city\n")
+
+        assert _ingest_csv_parallel(path, "organization", "name", False, 100, 2) == (0, 0)
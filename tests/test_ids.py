@@ -2,8 +2,16 @@
 
 import pytest
 
-from fkg.ids.canonicalize import canonicalize, canonical_json, normalize_name, normalize_string
+from fkg.ids.canonicalize import (
+    canonical_json,
+    canonical_json_bytes,
+    canonicalize,
+    clear_caches,
+    normalize_name,
+    normalize_string,
+)
 from fkg.ids.make_id import make_id, make_edge_id, compute_content_hash
+from fkg.ids.uuid7 import uuid7
 
 
 class TestNormalizeString:
@@ -25,6 +33,14 @@ class TestNormalizeString:
 
     def test_non_string(self):
         assert normalize_string(123) == 123
+        assert normalize_string(["A"]) == ["A"]  # Unhashable values pass through
+
+    def test_results_are_memoized(self):
+        clear_caches()
+        assert normalize_string("Food  Bank") == normalize_string("Food  Bank") == "food bank"
+        assert normalize_name("Acme Inc.") == normalize_name("Acme Inc.") == "acme"
+        clear_caches()
+        assert normalize_string("Food  Bank") == "food bank"
 
 
 class TestNormalizeName:
@@ -41,6 +57,11 @@ class TestNormalizeName:
         assert normalize_name("Acme Corp.") == "acme"
         assert normalize_name("Acme Corporation") == "acme"
 
+    def test_stacked_suffixes_stripped_in_list_order(self):
+        assert normalize_name("Acme Co. Inc.") == "acme"
+        assert normalize_name("Acme Inc. Co.") == "acme inc"
+        assert normalize_name("Acme Incorporated") == "acme"
+
     def test_remove_punctuation(self):
         assert normalize_name("O'Brien & Associates") == "obrien associates"
 
@@ -81,6 +102,26 @@ class TestCanonicalize:
         result = canonicalize(payload, normalize_names=False)
         assert result["tags"] == ["food", "housing", "healthcare"]
 
+    def test_drops_containers_that_become_empty(self):
+        payload = {"a": {"b": {"c": None}}, "tags": [None, "", {"x": ""}], "keep": 1}
+        result = canonicalize(payload, normalize_names=False)
+        assert result == {"keep": 1}
+
+    def test_deeply_nested_payload(self):
+        import sys
+
+        depth = sys.getrecursionlimit() * 2
+        payload = node = {}
+        for _ in range(depth):
+            node["child"] = {"name": "Acme Inc.", "items": []}
+            node = node["child"]
+
+        result = canonicalize(payload)
+        for _ in range(depth - 1):
+            result = result["child"]
+            assert result["name"] == "acme"
+        assert result["child"] == {"name": "acme"}
+
 
 class TestCanonicalJson:
     """Tests for canonical JSON generation."""
@@ -96,6 +137,24 @@ class TestCanonicalJson:
         result = canonical_json(payload)
         assert " " not in result  # No spaces in compact JSON
 
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"lat": 37.97, "small": 0.00005, "tiny": 1.5e-7, "big": 1e16},
+            {"count": 2**70},
+            {"rows": [[{"b": 1, "a": "Café"}], [None]]},
+            {"ctrl": "a\x00b\x1f", "emoji": "😀"},
+        ],
+    )
+    def test_matches_json_dumps(self, payload):
+        import json
+
+        expected = json.dumps(
+            canonicalize(payload), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+        assert canonical_json(payload) == expected
+        assert canonical_json_bytes(payload) == expected.encode("utf-8")
+
 
 class TestMakeId:
     """Tests for ID generation."""
@@ -170,3 +229,21 @@ class TestComputeContentHash:
         payload = {"name": "Test"}
         content_hash = compute_content_hash(payload)
         assert len(content_hash) == 64  # Full SHA256 hex
+
+
+class TestUuid7:
+    """Tests for time-ordered UUID generation."""
+
+    def test_version_and_variant(self):
+        import uuid
+
+        value = uuid.UUID(uuid7())
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_sorted_by_creation_time(self):
+        ids = [uuid7() for _ in range(1000)]
+        # Timestamp and sub-millisecond fraction; the rest is random
+        prefixes = [value[:18] for value in ids]
+        assert prefixes == sorted(prefixes)
+        assert len(set(ids)) == len(ids)
@@ -72,6 +72,14 @@ class TestPkgRoundtrip:
             assert len(mismatches) == 1
             assert "entities.jsonl" in mismatches[0]
 
+            # Missing files are reported alongside mismatches, in manifest order
+            (output_dir / "edges.jsonl").unlink()
+            mismatches = verify_checksums(output_dir, manifest)
+            assert mismatches == [
+                "entities.jsonl: checksum mismatch",
+                "edges.jsonl: file missing",
+            ]
+
     def test_validate_pkg(self):
         """Test PKG validation."""
         from fkg.pkg.import_ import validate_pkg
@@ -143,3 +151,207 @@ class TestJsonlFormat:
         assert parsed["type"] == "ORG_OFFERS_SERVICE"
         assert parsed["src_id"] == sample_edge["src_id"]
         assert parsed["dst_id"] == sample_edge["dst_id"]
+
+    def test_import_batches_keep_order_and_schema_version(self):
+        """Test import batches are bounded and never mix schema versions."""
+        from fkg.pkg.import_ import _read_batches
+
+        records = [{"id": str(i)} for i in range(5)]
+        records[3]["schema_version"] = "v0.2"
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "entities.jsonl"
+            path.write_text("".join(json.dumps(r) + "\n\n" for r in records))
+
+            batches = list(_read_batches(path, batch_size=2))
+
+        assert [(version, [r["id"] for r in batch]) for version, batch in batches] == [
+            ("v0.1", ["0", "1"]),
+            ("v0.1", ["2"]),
+            ("v0.2", ["3"]),
+            ("v0.1", ["4"]),
+        ]
+
+
+class TestPkgArchive:
+    """Tests for streaming PKG zip archives."""
+
+    def test_stream_zip_roundtrip(self):
+        """Test streamed zip contains every written file with identical content."""
+        import io
+        import zipfile
+
+        from fkg.pkg.archive import stream_zip
+
+        payload = "".join(f'{{"id": "{i * 7919 % 100003}"}}\n' for i in range(5000)).encode()
+
+        def produce(write):
+            write("entities.jsonl", iter([payload[:1000], payload[1000:]]))
+            write("manifest.json", [b"{}"])
+
+        chunks = list(stream_zip(produce, chunk_size=1024))
+        assert len(chunks) > 1
+
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == ["entities.jsonl", "manifest.json"]
+            assert zf.read("entities.jsonl") == payload
+
+    def test_stream_zip_propagates_errors(self):
+        """Test errors raised while producing reach the consumer."""
+        from fkg.pkg.archive import stream_zip
+
+        def produce(write):
+            raise RuntimeError("export failed")
+
+        with pytest.raises(RuntimeError, match="export failed"):
+            list(stream_zip(produce))
+
+    def test_extract_zip_stream_roundtrip(self):
+        """Test a streamed zip extracts in one pass, whatever the chunking."""
+        from fkg.pkg.archive import extract_zip_stream, stream_zip
+
+        payload = "".join(f'{{"id": "{i * 7919 % 100003}"}}\n' for i in range(5000)).encode()
+
+        def produce(write):
+            write("entities.jsonl", [payload])
+            write("signatures/manifest.sig", [b"sig"])
+
+        data = b"".join(stream_zip(produce))
+
+        for size in (1, 1000, len(data)):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                chunks = (data[i:i + size] for i in range(0, len(data), size))
+                names = extract_zip_stream(chunks, Path(tmpdir))
+
+                assert names == ["entities.jsonl", "signatures/manifest.sig"]
+                assert (Path(tmpdir) / "entities.jsonl").read_bytes() == payload
+                assert (Path(tmpdir) / "signatures" / "manifest.sig").read_bytes() == b"sig"
+
+    def test_extract_zip_stream_inflates_in_bounded_pieces(self, monkeypatch):
+        """Test a highly compressed entry never inflates into one huge piece."""
+        import io
+        import zipfile
+
+        from fkg.pkg import archive
+
+        payload = b"0" * (8 * archive.CHUNK_SIZE + 1)
+        inflate = archive._inflate
+        largest = 0
+
+        def checked_inflate(decompressor, data):
+            nonlocal largest
+            for piece in inflate(decompressor, data):
+                largest = max(largest, len(piece))
+                yield piece
+
+        monkeypatch.setattr(archive, "_inflate", checked_inflate)
+
+        # With data descriptors (streamed) and with sizes in the local header
+        streamed = b"".join(archive.stream_zip(lambda write: write("a.jsonl", [payload])))
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("a.jsonl", payload)
+
+        for data in (streamed, buffer.getvalue()):
+            largest = 0
+            with tempfile.TemporaryDirectory() as tmpdir:
+                assert archive.extract_zip_stream([data], Path(tmpdir)) == ["a.jsonl"]
+                assert (Path(tmpdir) / "a.jsonl").read_bytes() == payload
+            assert 0 < largest <= archive.CHUNK_SIZE
+
+    def test_extract_zip_stream_rejects_bad_archives(self):
+        """Test corrupt data and escaping entry names are rejected."""
+        import io
+        import zipfile
+
+        from fkg.pkg.archive import ZipStreamError, extract_zip_stream
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+            zf.writestr("entities.jsonl", b"x" * 100)
+        corrupt = bytearray(buffer.getvalue())
+        corrupt[60] ^= 0xFF
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("../evil.jsonl", b"x")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ZipStreamError, match="CRC"):
+                extract_zip_stream([bytes(corrupt)], Path(tmpdir))
+            with pytest.raises(ZipStreamError, match="escapes"):
+                extract_zip_stream([buffer.getvalue()], Path(tmpdir))
+
+    def test_export_pkg_to_writer_checksums(self):
+        """Test manifest checksums match the bytes handed to the writer."""
+        import hashlib
+
+        from fkg.pkg.export import write_jsonl
+
+        files = {}
+
+        def writer(name, chunks):
+            files[name] = b"".join(chunks)
+
+        count, checksum = write_jsonl(writer, "entities.jsonl", [{"id": "a"}, {"id": "b"}])
+
+        assert count == 2
+        assert files["entities.jsonl"] == b'{"id":"a"}\n{"id":"b"}\n'
+        assert checksum == hashlib.sha256(files["entities.jsonl"]).hexdigest()
+
+    def test_write_jsonl_roundtrips_wide_integers_and_unicode(self):
+        """Test records orjson cannot encode still export as valid JSONL."""
+        from fkg.pkg.export import write_jsonl
+
+        files = {}
+
+        def writer(name, chunks):
+            files[name] = b"".join(chunks)
+
+        records = [{"id": "a", "name": "Café"}, {"id": "b", "count": 2**70}]
+        count, _ = write_jsonl(writer, "entities.jsonl", records)
+
+        lines = files["entities.jsonl"].decode("utf-8").splitlines()
+        assert count == 2
+        assert [json.loads(line) for line in lines] == records
+
+    def test_write_jsonl_formats_datetimes_with_isoformat(self):
+        """Test datetimes are written as isoformat() on both serializer paths."""
+        from datetime import datetime, timedelta, timezone
+
+        from fkg.pkg.export import write_jsonl
+
+        files = {}
+
+        def writer(name, chunks):
+            files[name] = b"".join(chunks)
+
+        created_at = datetime(2024, 5, 1, 12, 30, 0, 250, tzinfo=timezone(timedelta(hours=5.5)))
+        records = [{"seq": 1, "created_at": created_at}, {"seq": 2**70, "created_at": created_at}]
+        write_jsonl(writer, "changelog.jsonl", records)
+
+        lines = files["changelog.jsonl"].decode("utf-8").splitlines()
+        assert [json.loads(line)["created_at"] for line in lines] == [created_at.isoformat()] * 2
+
+    def test_compressed_jsonl_roundtrip(self):
+        """Test gzipped JSONL is checksummed as written and read back by import."""
+        import gzip
+        import hashlib
+
+        from fkg.pkg.export import directory_writer, write_jsonl
+        from fkg.pkg.import_ import _read_records
+
+        records = [{"id": str(i), "name": "Café"} for i in range(1000)]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            count, checksum = write_jsonl(
+                directory_writer(output_dir), "entities.jsonl.gz", records, compress=True
+            )
+
+            path = output_dir / "entities.jsonl.gz"
+            assert count == 1000
+            assert checksum == hashlib.sha256(path.read_bytes()).hexdigest()
+            assert gzip.decompress(path.read_bytes()).count(b"\n") == 1000
+            assert list(_read_records(path)) == records
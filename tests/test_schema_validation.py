@@ -3,7 +3,12 @@
 import pytest
 
 from fkg.validate.registry import SchemaRegistry
-from fkg.validate.validate import ValidationError, validate_entity, validate_edge
+from fkg.validate.validate import (
+    ValidationError,
+    _get_validator,
+    validate_edge,
+    validate_entity,
+)
 
 
 class TestSchemaRegistry:
@@ -41,26 +46,18 @@ class TestSchemaRegistry:
             registry.get_entity_schema("nonexistent", "v0.1")
 
 
+@pytest.mark.usefixtures("schema_registry")
 class TestValidateEntity:
     """Tests for entity validation."""
 
-    def test_valid_organization(self, schemas_dir, sample_organization):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_valid_organization(self, sample_organization):
         # Should not raise
         validate_entity(sample_organization, "organization", "v0.1")
 
-    def test_valid_service(self, schemas_dir, sample_service):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_valid_service(self, sample_service):
         validate_entity(sample_service, "service", "v0.1")
 
-    def test_missing_required_field(self, schemas_dir):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_missing_required_field(self):
         # Missing 'name' which is required
         invalid_org = {
             "type": "organization",
@@ -72,10 +69,7 @@ class TestValidateEntity:
 
         assert "name" in str(exc_info.value.errors)
 
-    def test_wrong_type_const(self, schemas_dir):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_wrong_type_const(self):
         # type must be "organization" for organization schema
         invalid_org = {
             "type": "service",  # Wrong type
@@ -85,36 +79,89 @@ class TestValidateEntity:
         with pytest.raises(ValidationError):
             validate_entity(invalid_org, "organization", "v0.1")
 
-    def test_type_inferred_from_data(self, schemas_dir, sample_organization):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_type_inferred_from_data(self, sample_organization):
         # Don't pass entity_type, let it be inferred
         validate_entity(sample_organization)
 
-    def test_unknown_type_raises(self, schemas_dir):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_unknown_type_raises(self):
         with pytest.raises(ValidationError):
             validate_entity({"type": "unknown", "name": "test"})
 
+    def test_does_not_fill_defaults_or_check_formats(self):
+        org = {
+            "id": "test:organization:1",
+            "type": "organization",
+            "name": "Test",
+            "address": {"city": "San Rafael"},
+            "contact": {"email": "not an email"},
+        }
+
+        # Validated twice so the cached validator is exercised too
+        validate_entity(org, "organization", "v0.1")
+        validate_entity(org, "organization", "v0.1")
+        assert org["address"] == {"city": "San Rafael"}
+
+    def test_validator_is_cached(self, schema_registry):
+        schema = schema_registry.get_entity_schema("organization", "v0.1")
+        assert schema_registry.get_entity_schema("organization", "v0.1") is schema
+        assert _get_validator(schema) is _get_validator(schema)
+
+    def test_compiled_validator_agrees_with_jsonschema(
+        self, schema_registry, sample_organization, sample_service, sample_edge
+    ):
+        fastjsonschema = pytest.importorskip("fastjsonschema")
+
+        org = {**sample_organization, "id": "test:organization:1"}
+        service = {**sample_service, "id": "test:service:1"}
+        edge = {**sample_edge, "id": "test:edge:1"}
+        cases = [
+            ("organization", org),
+            ("organization", sample_organization),
+            ("organization", {**org, "contact": {"email": "not an email"}}),
+            ("organization", {**org, "type": "service"}),
+            ("service", service),
+            ("service", {**service, "name": 42}),
+            (None, edge),
+            (None, {**edge, "type": "INVALID_TYPE"}),
+        ]
+
+        for entity_type, record in cases:
+            if entity_type is None:
+                schema = schema_registry.get_edge_schema("v0.1")
+            else:
+                schema = schema_registry.get_entity_schema(entity_type, "v0.1")
+            validator = _get_validator(schema)
+            assert validator._compiled is not None
+
+            try:
+                validator._compiled(record)
+                compiled_accepts = True
+            except fastjsonschema.JsonSchemaValueException:
+                compiled_accepts = False
+            assert compiled_accepts == validator._validator.is_valid(record), record
+
+    def test_schema_draft_is_honoured(self):
+        schema = {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "array",
+            "prefixItems": [{"type": "string"}],
+        }
+
+        # prefixItems means nothing to draft 7, which would accept both
+        assert _get_validator(schema).errors(["a", 1]) == []
+        assert _get_validator(schema).errors([1]) == ["0: 1 is not of type 'string'"]
 
+
+@pytest.mark.usefixtures("schema_registry")
 class TestValidateEdge:
     """Tests for edge validation."""
 
-    def test_valid_edge(self, schemas_dir, sample_edge):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_valid_edge(self, sample_edge):
         # Add required id field
         edge = {**sample_edge, "id": "test:edge:123"}
         validate_edge(edge, "v0.1")
 
-    def test_missing_src_id(self, schemas_dir):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_missing_src_id(self):
         invalid_edge = {
             "id": "test:edge:123",
             "type": "ORG_OFFERS_SERVICE",
@@ -126,10 +173,7 @@ class TestValidateEdge:
 
         assert "src_id" in str(exc_info.value.errors)
 
-    def test_invalid_edge_type(self, schemas_dir):
-        from fkg.validate.registry import set_registry, SchemaRegistry
-        set_registry(SchemaRegistry(schemas_dir))
-
+    def test_invalid_edge_type(self):
         invalid_edge = {
             "id": "test:edge:123",
             "type": "INVALID_TYPE",  # Not in enum
@@ -0,0 +1,58 @@
+"""Tests for JSON decoding helpers."""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from fkg.serialization import dumps_json, loads_json
+
+
+class TestLoadsJson:
+    """Tests for loads_json."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"name": "Café", "tags": ["a", "b"], "n": null}',
+            '{"count": 123456789012345678901234567890}',
+            '{"low": -9223372036854775809, "high": 18446744073709551616}',
+            '{"lat": 37.97, "tiny": 1.5e-7}',
+            '{"x": NaN, "y": Infinity}',
+            "[1e400]",
+        ],
+    )
+    def test_matches_json_loads(self, text):
+        expected = json.loads(text)
+        for data in (text, text.encode("utf-8")):
+            result = loads_json(data)
+            assert repr(result) == repr(expected)
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(ValueError):
+            loads_json(b"not json")
+
+
+class TestDumpsJson:
+    """Tests for dumps_json."""
+
+    def test_matches_compact_json_dumps(self):
+        value = {"name": "Café", "tags": ["a", "b"], "n": None, "lat": 37.97}
+        expected = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        assert dumps_json(value) == expected.encode("utf-8")
+
+    def test_wide_int_falls_back_to_json(self):
+        value = {
+            "count": 123456789012345678901234567890,
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        }
+        encoded = dumps_json(value)
+        assert encoded == (
+            b'{"count":123456789012345678901234567890,'
+            b'"created_at":"2024-01-02T03:04:05+00:00"}'
+        )
+        assert loads_json(encoded)["count"] == value["count"]
+
+    def test_unserializable_raises(self):
+        with pytest.raises(TypeError):
+            dumps_json({"x": object()})